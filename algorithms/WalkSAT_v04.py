@@ -4,262 +4,23 @@ Created on Wed Mar 20 20:34:02 2024
 @author: Sergio
 """
 
-import subprocess
-import random
-import tempfile
-import os
-import shutil
-import traceback
-
-class WalkSAT:
-    # Initialize the WalkSAT solver with the given parameters
-    def __init__(self, variables, clauses, clauseLength, seed, modularity, communities):
-        self.variables = variables  # Number of variables in the formula
-        self.clauses = clauses       # Number of clauses in the formula
-        self.clauseLength = clauseLength  # Number of literals per clause
-        self.seed = seed            # Seed for randomness
-        self.modularity = modularity
-        self.communities = communities
-        self.formula, self.communities_variables, self.variable_to_community, self.clause_community_count = self.generate_random_model()
-
-    # Generates a random SAT model using an external program
-    def generate_random_model(self):
-        temp_dir = tempfile.mkdtemp()
-        file_formula = os.path.join(temp_dir, "community_formula.txt")
-        file_communities = os.path.join(temp_dir, "communities.txt")
-
-        try:
-            path_generator_model = "./generator/communityAttachment/commAttach"
-            arguments = ['-n', str(self.variables), '-m', str(self.clauses),
-                        '-k', str(self.clauseLength), '-c', str(self.communities),
-                        '-Q', str(self.modularity), '-s', str(self.seed)]
-
-            process = subprocess.Popen(
-                [path_generator_model] + arguments, stdout=subprocess.PIPE)
-            output, _ = process.communicate()
-            decoded_output = output.decode("utf-8")
-
-            with open(file_formula, "w") as file:
-                file.write(decoded_output)
-
-            path_features_s = "./generator/graph_features_sat_v_2_2/features_s"
-            arguments = ["-5", "-q", file_communities, file_formula]
-            process = subprocess.Popen(
-                [path_features_s] + arguments, stdout=subprocess.PIPE)
-            output, _ = process.communicate()
-
-            with open(file_communities, "r") as file:
-                lines = file.readlines()
-
-            community_to_vars = {}
-            for var, line in enumerate(lines, start=1):
-                community = int(line.strip())
-                if community not in community_to_vars:
-                    community_to_vars[community] = []
-                community_to_vars[community].append(var)
-
-            communities_variables = {}
-            for var_list in community_to_vars.values():
-                if len(var_list) > 1:  
-                    for var in var_list:
-                        communities_variables[var] = [v for v in var_list if v != var]
-
-            variable_to_community = {var: community for community, vars_list in community_to_vars.items() if len(vars_list) > 1 for var in vars_list}
-
-            formula = [[int(value) for value in line.split()[:-1]]
-                    for line in decoded_output.splitlines()[8:]]
-
-            clause_community_count = []
-            for clause in formula:
-                community_count = {}
-                for var in clause:
-                    var_abs = abs(var)
-                    if var_abs in variable_to_community:
-                        community = variable_to_community[var_abs]
-                        if community in community_count:
-                            community_count[community] += 1
-                        else:
-                            community_count[community] = 1
-                clause_community_count.append(community_count)
-
-            return formula, communities_variables, variable_to_community, clause_community_count
-
-        finally:
-            shutil.rmtree(temp_dir)
-
-    # Evaluates the given assignment to determine which clauses are satisfied
-    def evaluate_formula(self, assignment, satisfied, clauses=None):
-        if clauses is None:
-            clauses = range(1, self.clauses + 1)
-        for clause in clauses:
-            satisfied[clause] = False
-            for literal in self.formula[clause-1]:
-                if (literal > 0 and assignment[abs(literal)]) or (literal < 0 and not assignment[abs(literal)]):
-                    satisfied[clause] = True
-                    break
-        return satisfied
-
-    # Builds a map of variables to the clauses they appear in
-    def get_variable_clauses(self, assignment):
-        variable_clauses = {}
-        score_clauses = {}
-        clause_assignment = {}
-        for clause_index in range(1,self.clauses + 1):
-            clause = self.formula[clause_index - 1]
-            score_clauses[clause_index] = 0
-            clause_assignment[clause_index] = []
-
-            for literal in clause:
-                if assignment[abs(literal)]:
-                    variable = literal
-                else:
-                    variable = -literal
-                clause_assignment[clause_index].append(variable)
-
-                if variable not in variable_clauses:
-                    variable_clauses[variable] = []
-                variable_clauses[variable].append(clause_index)
-
-                if variable > 0:
-                    score_clauses[clause_index] += 1
-        return variable_clauses, score_clauses, clause_assignment
-
-    # Calculates the total number of clauses that are satisfied
-    def get_satisfied_total(self, satisfied):
-        return sum(value for value in satisfied.values())
-        
-    # Selects an unsatisfied clause prioritizing problematic communities
-    def select_unsatisfied_clause(self, unsatisfied, community_stats):
-        weights = []
-        for clause in unsatisfied:
-            clause_index = clause - 1
-            weight = 1.0  # Valor por defecto
-
-            if clause_index < len(self.clause_community_count):
-                comm_count = self.clause_community_count[clause_index]
-                if comm_count:
-                    weight = sum(
-                        (1 - (community_stats[c]["satisfied"] / max(1, community_stats[c]["total"]))) * cnt
-                        for c, cnt in comm_count.items()
-                    )
-            weights.append(weight)
-        if sum(weights) == 0:
-            raise ValueError("No problematic communities to select unsatisfied clause")
-        return random.choices(unsatisfied, weights=weights, k=1)[0]
-
-
-
-    # Main method to attempt solving the SAT problem, allowing flips and retries
-    def solve(self, max_flips, max_tries, probability):
-        clause_variable_info = {}
-        for clause_idx, clause in enumerate(self.formula, start=1):
-            var_indices = {abs(lit): i for i, lit in enumerate(clause)}
-            clause_variable_info[clause_idx] = var_indices
-
-        for tries in range(max_tries):
-            assignment = {var: random.choice([True, False]) for var in range(1, self.variables+1)}
-
-            communities = set(self.variable_to_community.values())
-
-            community_stats = {
-                comm: {"satisfied": 0, "total": 0}
-                for comm in communities
-            }
-
-            variable_clauses, score_clauses, _ = self.get_variable_clauses(assignment)
-            satisfied_total = sum(1 for score in score_clauses.values() if score != 0)
-
-            if satisfied_total == self.clauses:
-                return True, tries + 1, 1
-
-            for clause in range(1, self.clauses + 1):
-                clause_index = clause - 1
-                if clause_index < len(self.clause_community_count):
-                    for comm in self.clause_community_count[clause_index]:
-                        community_stats[comm]["total"] += 1
-                        if score_clauses[clause] > 0:  
-                            community_stats[comm]["satisfied"] += 1
-
-            for flips in range(max_flips):
-
-                unsatisfied = [clause for clause, score in score_clauses.items() if score == 0]
-                if not unsatisfied:  
-                    return True, tries+1, flips+1
-
-                if len(unsatisfied) == 1:
-                    current_clause = unsatisfied[0]
-                else:
-                    current_clause = self.select_unsatisfied_clause(unsatisfied, community_stats)
-
-                free_move = False
-                best_move = None
-                best_break_count = float('inf')
-                move_candidates = []
-
-                for literal in self.formula[current_clause-1]:
-                    var = abs(literal)
-                    current_value = assignment[var]
-
-                    break_count = 0
-                    new_scores = {}
-                    new_satisfied = satisfied_total
-
-                    affected_clauses = variable_clauses.get(var if current_value else -var, []) + \
-                                    variable_clauses.get(-var if current_value else var, [])
-
-                    for clause in affected_clauses:
-                        old_score = score_clauses[clause]
-                        literal_sign = 1 if (var in self.formula[clause-1]) else -1
-
-                        if (current_value and literal_sign > 0) or (not current_value and literal_sign < 0):
-                            new_score = old_score - 1 if old_score != 0 else 0
-                        else:
-                            new_score = old_score + 1 if old_score != 3 else 3
-
-                        if old_score == 1 and new_score == 0:
-                            break_count += 1
-                            new_satisfied -= 1
-                        elif old_score == 0 and new_score == 1:
-                            new_satisfied += 1
-
-                        new_scores[clause] = new_score
-
-                    move_info = {
-                        'var': var,
-                        'break_count': break_count,
-                        'new_scores': new_scores,
-                        'new_satisfied': new_satisfied,
-                        'old_key': var if current_value else -var,
-                        'new_key': -var if current_value else var
-                    }
-                    move_candidates.append(move_info)
-
-                    if break_count == 0:
-                        best_move = move_info
-                        free_move = True
-                        break
-
-                    if break_count < best_break_count:
-                        best_break_count = break_count
-                        best_move = move_info
-
-                if not free_move and random.random() < probability:
-                    best_move = random.choice(move_candidates)
-
-                assignment[best_move['var']] = not assignment[best_move['var']]
-
-                if best_move['old_key'] in variable_clauses:
-                    if best_move['new_key'] in variable_clauses:
-                        variable_clauses[best_move['old_key']], variable_clauses[best_move['new_key']] = \
-                            variable_clauses[best_move['new_key']], variable_clauses[best_move['old_key']]
-                    else:
-                        variable_clauses[best_move['new_key']] = variable_clauses.pop(best_move['old_key'])
-
-                for clause, score in best_move['new_scores'].items():
-                    score_clauses[clause] = score
-                satisfied_total = best_move['new_satisfied']
-
-                if satisfied_total == self.clauses:
-                    return True, tries+1, flips+1
-
-        return False, max_tries, max_flips
+from algorithms.community_selector import CommunitySelector
+from algorithms.local_search import CommunityWalkSAT
+
+class WalkSAT(CommunityWalkSAT):
+    # Picks unsatisfied clauses weighted towards the communities with most unsatisfied clauses
+    def __init__(self, variables, clauses, clauseLength, seed, modularity, communities, generator='external', partition='louvain', rng=None):
+        super().__init__(variables, clauses, clauseLength, seed, modularity, communities, generator, partition, rng)
+        self.selector = CommunitySelector(self.store, self.variable_to_community)  # Community-weighted pick of unsatisfied clauses
+
+    def reset(self, assignment):
+        return self.selector.reset(assignment)
+
+    def flip(self, var, assignment):
+        return self.selector.flip(var, assignment)
+
+    def select_clause(self):
+        unsatisfied = self.store.unsatisfied
+        if len(unsatisfied) == 1:
+            return unsatisfied.items[0]
+        return self.selector.select(self.rng)
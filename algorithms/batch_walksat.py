@@ -0,0 +1,174 @@
+"""
+Created on Sat Oct 17 16:05:37 2026
+
+@author: Sergio
+"""
+
+import numpy as np
+
+SENTINEL_COUNT = 2  # True count of the padding clause: never 0 (unsatisfied) nor 1 (breakable)
+
+# Clauses of a ClauseStore as an (m, k) array, all clauses must have the same length
+def clause_matrix(store):
+    literals = np.frombuffer(store.literals, dtype=np.int32)
+    if store.clauses and len(literals) % store.clauses:
+        raise ValueError("All clauses must have the same number of literals")
+    return literals.reshape(store.clauses, -1)
+
+class BatchWalkSAT:
+    # Runs B independent WalkSAT walks in lockstep with NumPy; walk b searches formulas[b].
+    # Formulas must share their shape (m clauses of k literals) and may be the same one repeated.
+    def __init__(self, formulas, variables, rng=None):
+        clauses = np.asarray(formulas, dtype=np.int64)
+        if clauses.ndim != 3:
+            raise ValueError("All formulas must have the same number of clauses and clause length")
+        self.walks, self.clauses, self.clauseLength = clauses.shape
+        self.variables = variables
+        self.rng = rng if rng is not None else np.random.default_rng()  # numpy Generator driving every walk
+
+        self.clause_vars = np.abs(clauses)  # (B, m, k) variable of every literal
+        self.clause_signs = clauses > 0  # (B, m, k) literal is positive
+
+        # Padded occurrence lists: occurrences[b, l] are the clauses of walk b containing the literal
+        # with index l (2*var for x, 2*var+1 for -x), padded with the sentinel clause m
+        walks, m, k = clauses.shape
+        size = 2 * variables + 2
+        literal_indices = np.where(clauses > 0, 2 * clauses, 1 - 2 * clauses).reshape(walks, m * k)
+        keys = (literal_indices + size * np.arange(walks)[:, None]).ravel()
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        rank = np.arange(len(sorted_keys)) - np.searchsorted(sorted_keys, sorted_keys)
+        degree = int(rank.max()) + 1 if len(rank) else 1
+        self.occurrences = np.full((walks * size, degree), m, dtype=np.int64)
+        self.occurrences[sorted_keys, rank] = (order % (m * k)) // k
+        self.occurrences = self.occurrences.reshape(walks, size, degree)
+
+    # Draws fresh random assignments for the given walks, recounts their true literals and
+    # rebuilds their lists of unsatisfied clauses
+    def _restart(self, walks, assignment, true_counts, unsatisfied, positions, sizes):
+        m = self.clauses
+        assignment[walks, 1:] = self.rng.random((len(walks), self.variables)) < 0.5
+        values = assignment[walks[:, None, None], self.clause_vars[walks]]
+        true_counts[walks, :m] = (values == self.clause_signs[walks]).sum(axis=2)
+
+        rows, clauses = np.nonzero(true_counts[walks, :m] == 0)
+        counts = np.bincount(rows, minlength=len(walks))
+        slots = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions[walks] = -1
+        unsatisfied[walks[rows], slots] = clauses
+        positions[walks[rows], clauses] = slots
+        sizes[walks] = counts
+
+    # Same search and accounting as WalkSAT.solve for every walk: returns a list of (success, tries, flips)
+    def solve(self, max_flips, max_tries, probability):
+        walks, m, k, n = self.walks, self.clauses, self.clauseLength, self.variables
+        literal_count = self.occurrences.shape[1]
+        rng = self.rng
+
+        assignment = np.zeros((walks, n + 1), dtype=bool)
+        true_counts = np.full((walks, m + 1), SENTINEL_COUNT, dtype=np.int32)
+        # Unsatisfied clauses of every walk: unsatisfied[b, :sizes[b]] in any order, positions[b, c] its slot
+        unsatisfied = np.zeros((walks, m), dtype=np.int64)
+        positions = np.full((walks, m), -1, dtype=np.int64)
+        sizes = np.zeros(walks, dtype=np.int64)
+        state = (assignment, true_counts, unsatisfied, positions, sizes)
+
+        # Flat views: element (b, i) of a row-major (walks, width) array is at b * width + i.
+        # One-dimensional fancy indexing is markedly faster than the equivalent 2-D indexing.
+        flat_assignment, flat_counts = assignment.reshape(-1), true_counts.reshape(-1)
+        flat_unsatisfied, flat_positions = unsatisfied.reshape(-1), positions.reshape(-1)
+        clause_rows = self.clause_vars.reshape(walks * m, k)
+        occurrence_rows = self.occurrences.reshape(walks * literal_count, -1)
+
+        success = np.zeros(walks, dtype=bool)
+        tries = np.ones(walks, dtype=np.int64)
+        flips = np.zeros(walks, dtype=np.int64)  # Flips performed in the current try
+        active = np.ones(walks, dtype=bool)
+        self._restart(np.arange(walks), *state)
+
+        while active.any():
+            current = np.flatnonzero(active)
+
+            # A satisfied formula before any flip counts as one flip, as in WalkSAT.solve
+            solved = sizes[current] == 0
+            success[current[solved]] = True
+            flips[current[solved]] = np.maximum(flips[current[solved]], 1)
+            active[current[solved]] = False
+
+            exhausted = ~solved & (flips[current] >= max_flips)
+            if exhausted.any():
+                ended = current[exhausted]
+                active[ended[tries[ended] >= max_tries]] = False
+                restarted = ended[tries[ended] < max_tries]
+                if len(restarted):
+                    tries[restarted] += 1
+                    flips[restarted] = 0
+                    self._restart(restarted, *state)
+
+            current = current[~solved & ~exhausted]
+            if not len(current):
+                continue
+            rows = np.arange(len(current))
+            count_base = (current * (m + 1))[:, None]
+            list_base = current * m
+
+            # Uniform unsatisfied clause of every walk
+            chosen = flat_unsatisfied[list_base + (rng.random(len(current)) * sizes[current]).astype(np.int64)]
+
+            # Break count of every candidate: clauses where its true literal is the only true one
+            candidates = clause_rows[list_base + chosen]  # (A, k)
+            values = flat_assignment[(current * (n + 1))[:, None] + candidates]
+            true_literals = 2 * candidates + ~values
+            touched = occurrence_rows[(current * literal_count)[:, None] + true_literals]  # (A, k, degree)
+            breaks = (flat_counts[count_base[:, :, None] + touched] == 1).sum(axis=2)
+
+            # First free move if any, otherwise the first minimum or, with the noise probability, a random one
+            free = breaks == 0
+            has_free = free.any(axis=1)
+            best = np.where(has_free, free.argmax(axis=1), breaks.argmin(axis=1))
+            noise = ~has_free & (rng.random(len(current)) < probability)
+            best = np.where(noise, rng.integers(0, k, len(current)), best)
+            var = candidates[rows, best]
+
+            # Flip: clauses of the old true literal lose a true literal, those of its negation gain one
+            old_true = true_literals[rows, best]
+            losing = touched[rows, best]  # (A, degree)
+            gaining = occurrence_rows[current * literal_count + (old_true ^ 1)]
+            losing_cells, gaining_cells = count_base + losing, count_base + gaining
+            flat_counts[losing_cells] -= 1
+            flat_counts[gaining_cells] += 1
+            broken = (flat_counts[losing_cells] == 0) & (losing < m)
+            repaired = (flat_counts[gaining_cells] == 1) & (gaining < m)
+            true_counts[:, m] = SENTINEL_COUNT
+            flat_assignment[current * (n + 1) + var] ^= True
+            flips[current] += 1
+
+            # Repaired clauses leave the lists by swapping in the last member, one per walk and round
+            repaired_rows, repaired_cols = np.nonzero(repaired)
+            if len(repaired_rows):
+                owners = current[repaired_rows]
+                clause_cells = owners * m + gaining[repaired_rows, repaired_cols]
+                rounds = np.arange(len(owners)) - np.searchsorted(repaired_rows, repaired_rows)
+                for round_number in range(int(rounds.max()) + 1):
+                    selected = rounds == round_number
+                    owner, cell = owners[selected], clause_cells[selected]
+                    base = owner * m
+                    slot_cells = base + flat_positions[cell]
+                    last = flat_unsatisfied[base + sizes[owner] - 1]
+                    flat_unsatisfied[slot_cells] = last
+                    flat_positions[base + last] = slot_cells - base
+                    flat_positions[cell] = -1
+                    sizes[owner] -= 1
+
+            # Broken clauses are appended after the current members
+            broken_rows, broken_cols = np.nonzero(broken)
+            if len(broken_rows):
+                owners = current[broken_rows]
+                clauses = losing[broken_rows, broken_cols]
+                slots = sizes[owners] + np.arange(len(owners)) - np.searchsorted(broken_rows, broken_rows)
+                flat_unsatisfied[owners * m + slots] = clauses
+                flat_positions[owners * m + clauses] = slots
+                sizes[current] += broken.sum(axis=1)
+
+        return [(bool(success[b]), int(tries[b]) if success[b] else max_tries,
+                 int(flips[b]) if success[b] else max_flips) for b in range(walks)]
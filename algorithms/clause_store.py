@@ -0,0 +1,119 @@
+"""
+Created on Sat Oct 17 10:12:41 2026
+
+@author: Sergio
+"""
+
+from array import array
+
+from algorithms.indexed_set import IndexedSet
+
+class ClauseStore:
+    # Packs a CNF formula (list of clauses) into flat int32 arrays built once per instance
+    def __init__(self, formula, variables):
+        self.variables = variables  # Number of variables in the formula
+        self.clauses = len(formula)  # Number of clauses in the formula
+
+        # Literals of every clause stored back to back; clause i spans offsets[i]:offsets[i+1]
+        self.literals = array('i')
+        self.offsets = array('i', [0])
+        for clause in formula:
+            self.literals.extend(clause)
+            self.offsets.append(len(self.literals))
+
+        # Literal -> clause occurrence lists in CSR form, literal l is stored at literal_index(l)
+        counts = [0] * (2 * variables + 3)
+        for literal in self.literals:
+            counts[self.literal_index(literal) + 1] += 1
+        for index in range(1, len(counts)):
+            counts[index] += counts[index - 1]
+        self.occurrence_offsets = array('i', counts)
+        self.occurrence_clauses = array('i', bytes(4 * len(self.literals)))
+        position = counts[:-1]
+        for clause in range(self.clauses):
+            for i in range(self.offsets[clause], self.offsets[clause + 1]):
+                index = self.literal_index(self.literals[i])
+                self.occurrence_clauses[position[index]] = clause
+                position[index] += 1
+
+        # Number of true literals of each clause under the current assignment
+        self.true_counts = array('i', bytes(4 * self.clauses))
+        # Clauses whose true-literal count is zero, kept in sync with true_counts
+        self.unsatisfied = IndexedSet(self.clauses)
+
+    # Position of a literal in the occurrence index: 2*var for x, 2*var+1 for -x
+    @staticmethod
+    def literal_index(literal):
+        return 2 * literal if literal > 0 else 1 - 2 * literal
+
+    # Returns the literals of a clause (0-based clause index)
+    def clause_literals(self, clause):
+        return self.literals[self.offsets[clause]:self.offsets[clause + 1]]
+
+    # Returns the clauses (0-based) in which the given literal appears
+    def occurrences(self, literal):
+        index = self.literal_index(literal)
+        return self.occurrence_clauses[self.occurrence_offsets[index]:self.occurrence_offsets[index + 1]]
+
+    # Recomputes the true-literal count of every clause and returns the number of satisfied clauses
+    def count_true_literals(self, assignment):
+        literals, offsets, true_counts = self.literals, self.offsets, self.true_counts
+        unsatisfied = self.unsatisfied
+        unsatisfied.clear()
+        satisfied_total = 0
+        for clause in range(self.clauses):
+            count = 0
+            for i in range(offsets[clause], offsets[clause + 1]):
+                literal = literals[i]
+                if assignment[abs(literal)] == (literal > 0):
+                    count += 1
+            true_counts[clause] = count
+            if count:
+                satisfied_total += 1
+            else:
+                unsatisfied.add(clause)
+        return satisfied_total
+
+    # Counts the clauses that flipping var would break, without materialising the move
+    def break_count(self, var, assignment):
+        true_counts, occurrence_clauses = self.true_counts, self.occurrence_clauses
+        index = 2 * var if assignment[var] else 2 * var + 1  # Literal of var that is currently true
+        count = 0
+        for i in range(self.occurrence_offsets[index], self.occurrence_offsets[index + 1]):
+            if true_counts[occurrence_clauses[i]] == 1:
+                count += 1
+        return count
+
+    # Counts the unsatisfied clauses that flipping var would satisfy
+    def make_count(self, var, assignment):
+        true_counts, occurrence_clauses = self.true_counts, self.occurrence_clauses
+        index = 2 * var + 1 if assignment[var] else 2 * var  # Literal of var that is currently false
+        count = 0
+        for i in range(self.occurrence_offsets[index], self.occurrence_offsets[index + 1]):
+            if true_counts[occurrence_clauses[i]] == 0:
+                count += 1
+        return count
+
+    # Flips var in place, updating true counts and the unsatisfied set; returns the satisfied total
+    def flip(self, var, assignment):
+        true_counts, occurrence_clauses, occurrence_offsets = self.true_counts, self.occurrence_clauses, self.occurrence_offsets
+        unsatisfied = self.unsatisfied
+        index = 2 * var if assignment[var] else 2 * var + 1
+        assignment[var] = not assignment[var]
+
+        for i in range(occurrence_offsets[index], occurrence_offsets[index + 1]):
+            clause = occurrence_clauses[i]
+            count = true_counts[clause] - 1
+            true_counts[clause] = count
+            if count == 0:
+                unsatisfied.add(clause)
+
+        index ^= 1
+        for i in range(occurrence_offsets[index], occurrence_offsets[index + 1]):
+            clause = occurrence_clauses[i]
+            count = true_counts[clause] + 1
+            true_counts[clause] = count
+            if count == 1:
+                unsatisfied.remove(clause)
+
+        return self.clauses - len(unsatisfied)
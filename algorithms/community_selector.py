@@ -0,0 +1,179 @@
+"""
+Created on Sat Oct 17 18:10:27 2026
+
+@author: Sergio
+"""
+
+from array import array
+
+from algorithms.indexed_set import IndexedSet
+from algorithms.sum_tree import SumTree
+
+class CommunitySelector:
+    # Samples unsatisfied clauses of a ClauseStore prioritising the communities with the most
+    # unsatisfied clauses. The weight of an unsatisfied clause is
+    #     sum over its communities c of (unsatisfied_c / total_c) * (variables of the clause in c)
+    # (1 if it has no community variables), with unsatisfied_c kept up to date as clauses break and
+    # are repaired. That sum is split by community: community c weighs (unsatisfied_c / total_c)
+    # times the number of its variable occurrences in unsatisfied clauses, a SumTree picks the
+    # community and one of those occurrences is picked uniformly.
+    def __init__(self, store, variable_to_community):
+        self.store = store
+        literals, offsets = store.literals, store.offsets
+        index = {community: position for position, community in enumerate(sorted(set(variable_to_community.values())))}
+        self.communities = len(index)
+
+        # Community of every literal occurrence (slot of store.literals), -1 if its variable has none
+        self.slot_community = array('i', [index.get(variable_to_community.get(abs(literal)), -1) for literal in literals])
+        self.slot_clause = array('i', bytes(4 * len(literals)))
+        self.clause_communities = []  # Distinct communities of every clause
+        self.totals = array('i', bytes(4 * self.communities))  # Clauses with variables of every community
+        for clause in range(store.clauses):
+            communities = []
+            for slot in range(offsets[clause], offsets[clause + 1]):
+                self.slot_clause[slot] = clause
+                community = self.slot_community[slot]
+                if community >= 0 and community not in communities:
+                    communities.append(community)
+                    self.totals[community] += 1
+            self.clause_communities.append(communities)
+
+        # Slots of the unsatisfied clauses grouped by community, and clauses without communities
+        self.slots = [[] for _ in range(self.communities)]
+        self.slot_position = array('i', [-1]) * len(literals)
+        self.plain = IndexedSet(store.clauses)
+        self.unsatisfied_counts = array('i', bytes(4 * self.communities))
+        self.in_pool = bytearray(store.clauses)
+        self.tree = SumTree(self.communities + 1)  # Leaf `communities` is the pool of plain clauses
+
+    # Recounts true literals for a fresh assignment and rebuilds the weights, returns the satisfied total
+    def reset(self, assignment):
+        satisfied_total = self.store.count_true_literals(assignment)
+        for slots in self.slots:
+            slots.clear()
+        for slot in range(len(self.slot_position)):
+            self.slot_position[slot] = -1
+        self.plain.clear()
+        for community in range(self.communities):
+            self.unsatisfied_counts[community] = 0
+        for clause in range(self.store.clauses):
+            self.in_pool[clause] = False
+
+        for clause in self.store.unsatisfied:
+            self._add(clause)
+        for community in range(self.communities + 1):
+            self._update_weight(community)
+        return satisfied_total
+
+    # Adds an unsatisfied clause to the pools
+    def _add(self, clause):
+        self.in_pool[clause] = True
+        communities = self.clause_communities[clause]
+        if not communities:
+            self.plain.add(clause)
+            return
+        offsets, slot_community, slot_position = self.store.offsets, self.slot_community, self.slot_position
+        for slot in range(offsets[clause], offsets[clause + 1]):
+            community = slot_community[slot]
+            if community >= 0:
+                slots = self.slots[community]
+                slot_position[slot] = len(slots)
+                slots.append(slot)
+        for community in communities:
+            self.unsatisfied_counts[community] += 1
+
+    # Removes a repaired clause from the pools, swapping the last member into each freed slot
+    def _remove(self, clause):
+        self.in_pool[clause] = False
+        communities = self.clause_communities[clause]
+        if not communities:
+            self.plain.remove(clause)
+            return
+        offsets, slot_community, slot_position = self.store.offsets, self.slot_community, self.slot_position
+        for slot in range(offsets[clause], offsets[clause + 1]):
+            community = slot_community[slot]
+            if community >= 0:
+                slots = self.slots[community]
+                last = slots.pop()
+                if last != slot:
+                    position = slot_position[slot]
+                    slots[position] = last
+                    slot_position[last] = position
+                slot_position[slot] = -1
+        for community in communities:
+            self.unsatisfied_counts[community] -= 1
+
+    # Recomputes the sampling weight of a community (or of the plain pool)
+    def _update_weight(self, community):
+        if community == self.communities:
+            weight = len(self.plain)
+        else:
+            # A community whose variables occur in no clause has no total (and never any weight)
+            weight = self.unsatisfied_counts[community] * len(self.slots[community]) / max(1, self.totals[community])
+        self.tree.update(community, weight)
+
+    # Flips var through the store and moves the clauses that broke or were repaired, returns the satisfied total
+    def flip(self, var, assignment):
+        store = self.store
+        true_counts, in_pool = store.true_counts, self.in_pool
+        true_literal = var if assignment[var] else -var
+        satisfied_total = store.flip(var, assignment)
+
+        changed = set()
+        for clause in store.occurrences(true_literal):
+            if true_counts[clause] == 0 and not in_pool[clause]:
+                self._add(clause)
+                changed.update(self.clause_communities[clause] or (self.communities,))
+        for clause in store.occurrences(-true_literal):
+            if true_counts[clause] > 0 and in_pool[clause]:
+                self._remove(clause)
+                changed.update(self.clause_communities[clause] or (self.communities,))
+        for community in changed:
+            self._update_weight(community)
+        return satisfied_total
+
+    # Draws an unsatisfied clause with probability proportional to its weight
+    def select(self, rng):
+        community = self.tree.sample(rng)
+        if community == self.communities:
+            return rng.choice(self.plain.items)
+        return self.slot_clause[rng.choice(self.slots[community])]
+
+# Variables of the dominant community (the one with most variables) of every clause, 0 if it has none
+def dominant_community_sizes(clause_community_count):
+    return array('i', [max(counts.values(), default=0) for counts in clause_community_count])
+
+class DominantCommunityPool:
+    # Unsatisfied clauses of a ClauseStore whose dominant community has exactly `size` variables,
+    # kept in an IndexedSet as clauses break and are repaired so a uniform pick is O(1)
+    def __init__(self, store, clause_community_count, size):
+        self.store = store
+        self.eligible = bytearray(dominant == size for dominant in dominant_community_sizes(clause_community_count))
+        self.clauses = IndexedSet(store.clauses)
+
+    def __len__(self):
+        return len(self.clauses)
+
+    # Recounts true literals for a fresh assignment and refills the pool, returns the satisfied total
+    def reset(self, assignment):
+        satisfied_total = self.store.count_true_literals(assignment)
+        self.clauses.clear()
+        for clause in self.store.unsatisfied:
+            if self.eligible[clause]:
+                self.clauses.add(clause)
+        return satisfied_total
+
+    # Flips var through the store and updates the pool with the clauses that broke or were repaired
+    def flip(self, var, assignment):
+        store, eligible, clauses = self.store, self.eligible, self.clauses
+        true_counts = store.true_counts
+        true_literal = var if assignment[var] else -var
+        satisfied_total = store.flip(var, assignment)
+
+        for clause in store.occurrences(true_literal):
+            if eligible[clause] and true_counts[clause] == 0:
+                clauses.add(clause)
+        for clause in store.occurrences(-true_literal):
+            if eligible[clause] and true_counts[clause] > 0:
+                clauses.remove(clause)
+        return satisfied_total
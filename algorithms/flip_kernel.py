@@ -0,0 +1,343 @@
+"""
+Created on Sat Oct 17 17:21:09 2026
+
+@author: Sergio
+"""
+
+import random
+
+import numpy as np
+
+# Numba is optional: without it the solvers keep their Python loops and this module is only
+# imported (its functions still run, unjitted, which is how the kernel is validated)
+try:
+    from numba import njit
+    AVAILABLE = True
+except ImportError:
+    AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+STATE_SIZE = 624  # Words of the Mersenne Twister state, followed by its position in random.getstate()
+
+# The kernels draw from a copy of the state of a random.Random and reproduce its genrand_uint32,
+# getrandbits, _randbelow, choice and random, so they consume exactly the same stream as the
+# Python solvers and return the same results for the same rng.
+
+# Next 32-bit output of the Mersenne Twister (state[STATE_SIZE] is the position)
+@njit(cache=True)
+def _genrand(state):
+    index = state[STATE_SIZE]
+    if index >= STATE_SIZE:
+        for i in range(STATE_SIZE):
+            y = (state[i] & 0x80000000) | (state[(i + 1) % STATE_SIZE] & 0x7fffffff)
+            value = state[(i + 397) % STATE_SIZE] ^ (y >> 1)
+            if y & 1:
+                value ^= 0x9908b0df
+            state[i] = value
+        index = 0
+    y = state[index]
+    state[STATE_SIZE] = index + 1
+    y ^= y >> 11
+    y ^= (y << 7) & 0x9d2c5680
+    y ^= (y << 15) & 0xefc60000
+    y ^= y >> 18
+    return y
+
+# random.Random._randbelow: uniform integer in [0, n) by rejection over getrandbits(n.bit_length())
+@njit(cache=True)
+def _randbelow(state, n):
+    bits = 0
+    while (n >> bits) > 0:
+        bits += 1
+    r = _genrand(state) >> (32 - bits)
+    while r >= n:
+        r = _genrand(state) >> (32 - bits)
+    return r
+
+# random.Random.random: 53-bit float in [0, 1)
+@njit(cache=True)
+def _random(state):
+    a = _genrand(state) >> 5
+    b = _genrand(state) >> 6
+    return (a * 67108864.0 + b) * (1.0 / 9007199254740992.0)
+
+# [False] + [rng.choice([True, False]) for _ in range(variables)]
+@njit(cache=True)
+def _random_assignment(state, assignment):
+    assignment[0] = 0
+    for var in range(1, len(assignment)):
+        assignment[var] = 1 if _randbelow(state, 2) == 0 else 0
+
+# ClauseStore.count_true_literals, with the unsatisfied IndexedSet as items/positions arrays
+@njit(cache=True)
+def _count_true_literals(literals, offsets, assignment, true_counts, items, positions):
+    size = 0
+    positions[:] = -1
+    satisfied_total = 0
+    for clause in range(len(true_counts)):
+        count = 0
+        for i in range(offsets[clause], offsets[clause + 1]):
+            literal = literals[i]
+            if assignment[abs(literal)] == (1 if literal > 0 else 0):
+                count += 1
+        true_counts[clause] = count
+        if count:
+            satisfied_total += 1
+        else:
+            positions[clause] = size
+            items[size] = clause
+            size += 1
+    return satisfied_total, size
+
+# Same search as WalkSAT.solve; returns (success, tries, flips)
+@njit(cache=True)
+def _walksat(literals, offsets, occurrence_offsets, occurrence_clauses, variables,
+             max_flips, max_tries, probability, state):
+    clauses = len(offsets) - 1
+    assignment = np.zeros(variables + 1, dtype=np.uint8)
+    true_counts = np.zeros(clauses, dtype=np.int32)
+    items = np.zeros(clauses, dtype=np.int32)
+    positions = np.full(clauses, -1, dtype=np.int32)
+
+    for tries in range(max_tries):
+        _random_assignment(state, assignment)
+        satisfied_total, size = _count_true_literals(literals, offsets, assignment, true_counts, items, positions)
+
+        if satisfied_total == clauses:
+            return True, tries + 1, 1
+
+        for flips in range(max_flips):
+            if size == 0:
+                return True, tries + 1, flips + 1
+
+            current_clause = items[_randbelow(state, size)]
+            start, end = offsets[current_clause], offsets[current_clause + 1]
+
+            # First variable with break count 0, otherwise the first with the minimum break count
+            free_move = False
+            best_var = 0
+            best_break_count = -1
+            for i in range(start, end):
+                var = abs(literals[i])
+                index = 2 * var if assignment[var] else 2 * var + 1
+                break_count = 0
+                for j in range(occurrence_offsets[index], occurrence_offsets[index + 1]):
+                    if true_counts[occurrence_clauses[j]] == 1:
+                        break_count += 1
+
+                if break_count == 0:
+                    best_var = var
+                    free_move = True
+                    break
+
+                if best_break_count < 0 or break_count < best_break_count:
+                    best_break_count = break_count
+                    best_var = var
+
+            if not free_move and _random(state) < probability:
+                best_var = abs(literals[start + _randbelow(state, end - start)])
+
+            # ClauseStore.flip, keeping the same order of additions and swap-removals
+            index = 2 * best_var if assignment[best_var] else 2 * best_var + 1
+            assignment[best_var] ^= 1
+            for j in range(occurrence_offsets[index], occurrence_offsets[index + 1]):
+                clause = occurrence_clauses[j]
+                true_counts[clause] -= 1
+                if true_counts[clause] == 0 and positions[clause] < 0:
+                    positions[clause] = size
+                    items[size] = clause
+                    size += 1
+            index ^= 1
+            for j in range(occurrence_offsets[index], occurrence_offsets[index + 1]):
+                clause = occurrence_clauses[j]
+                true_counts[clause] += 1
+                if true_counts[clause] == 1 and positions[clause] >= 0:
+                    size -= 1
+                    last = items[size]
+                    if last != clause:
+                        items[positions[clause]] = last
+                        positions[last] = positions[clause]
+                    positions[clause] = -1
+
+            if size == 0:
+                return True, tries + 1, flips + 1
+
+    return False, max_tries, max_flips
+
+# GSATEngine._rebucket over fixed-capacity bucket rows
+@njit(cache=True)
+def _rebucket(var, make, breaks, offset, buckets, bucket_sizes, bucket_of, bucket_position, best_bucket):
+    target = make[var] - breaks[var] + offset
+    current = bucket_of[var]
+    if current == target:
+        return best_bucket
+    if current >= 0:
+        bucket_sizes[current] -= 1
+        last = buckets[current, bucket_sizes[current]]
+        if last != var:
+            position = bucket_position[var]
+            buckets[current, position] = last
+            bucket_position[last] = position
+    bucket_position[var] = bucket_sizes[target]
+    buckets[target, bucket_sizes[target]] = var
+    bucket_sizes[target] += 1
+    bucket_of[var] = target
+    return max(best_bucket, target)
+
+# Same search as GSAT.solve on a GSATEngine; returns (success, tries, flips)
+@njit(cache=True)
+def _gsat(literals, offsets, occurrence_offsets, occurrence_clauses, variables, occurring_variables,
+          offset, max_flips, max_tries, state):
+    clauses = len(offsets) - 1
+    size = variables + 1
+    assignment = np.zeros(size, dtype=np.uint8)
+    true_counts = np.zeros(clauses, dtype=np.int32)
+    items = np.zeros(clauses, dtype=np.int32)
+    positions = np.full(clauses, -1, dtype=np.int32)
+    make = np.zeros(size, dtype=np.int32)
+    breaks = np.zeros(size, dtype=np.int32)
+    buckets = np.zeros((2 * offset + 1, max(1, len(occurring_variables))), dtype=np.int32)
+    bucket_sizes = np.zeros(2 * offset + 1, dtype=np.int32)
+    bucket_of = np.full(size, -1, dtype=np.int32)
+    bucket_position = np.full(size, -1, dtype=np.int32)
+    touched = np.zeros(size, dtype=np.int32)
+    is_touched = np.zeros(size, dtype=np.uint8)
+
+    for tries in range(max_tries):
+        _random_assignment(state, assignment)
+
+        # GSATEngine.reset
+        make[:] = 0
+        breaks[:] = 0
+        satisfied_total, _ = _count_true_literals(literals, offsets, assignment, true_counts, items, positions)
+        for clause in range(clauses):
+            count = true_counts[clause]
+            if count == 0:
+                for i in range(offsets[clause], offsets[clause + 1]):
+                    make[abs(literals[i])] += 1
+            elif count == 1:
+                for i in range(offsets[clause], offsets[clause + 1]):
+                    literal = literals[i]
+                    if assignment[abs(literal)] == (1 if literal > 0 else 0):
+                        breaks[abs(literal)] += 1
+                        break
+        bucket_sizes[:] = 0
+        best_bucket = 0
+        for var in occurring_variables:
+            bucket_of[var] = -1
+            best_bucket = _rebucket(var, make, breaks, offset, buckets, bucket_sizes, bucket_of, bucket_position, best_bucket)
+
+        if satisfied_total == clauses:
+            return True, tries + 1, 1
+
+        for flips in range(max_flips):
+            # GSATEngine.best_variable
+            while bucket_sizes[best_bucket] == 0:
+                best_bucket -= 1
+            var = buckets[best_bucket, 0]
+            for position in range(1, bucket_sizes[best_bucket]):
+                var = min(var, buckets[best_bucket, position])
+
+            # GSATEngine.flip, rebucketing the touched variables in order of first touch
+            satisfied_total += make[var] - breaks[var]
+            index = 2 * var if assignment[var] else 2 * var + 1
+            assignment[var] ^= 1
+            touched[0] = var
+            is_touched[var] = 1
+            touched_count = 1
+
+            for j in range(occurrence_offsets[index], occurrence_offsets[index + 1]):
+                clause = occurrence_clauses[j]
+                count = true_counts[clause] - 1
+                true_counts[clause] = count
+                start, end = offsets[clause], offsets[clause + 1]
+                if count == 0:
+                    breaks[var] -= 1
+                    for i in range(start, end):
+                        other = abs(literals[i])
+                        make[other] += 1
+                        if not is_touched[other]:
+                            is_touched[other] = 1
+                            touched[touched_count] = other
+                            touched_count += 1
+                elif count == 1:
+                    for i in range(start, end):
+                        literal = literals[i]
+                        other = abs(literal)
+                        if assignment[other] == (1 if literal > 0 else 0):
+                            breaks[other] += 1
+                            if not is_touched[other]:
+                                is_touched[other] = 1
+                                touched[touched_count] = other
+                                touched_count += 1
+                            break
+
+            index ^= 1
+            for j in range(occurrence_offsets[index], occurrence_offsets[index + 1]):
+                clause = occurrence_clauses[j]
+                count = true_counts[clause] + 1
+                true_counts[clause] = count
+                start, end = offsets[clause], offsets[clause + 1]
+                if count == 1:
+                    breaks[var] += 1
+                    for i in range(start, end):
+                        other = abs(literals[i])
+                        make[other] -= 1
+                        if not is_touched[other]:
+                            is_touched[other] = 1
+                            touched[touched_count] = other
+                            touched_count += 1
+                elif count == 2:
+                    for i in range(start, end):
+                        literal = literals[i]
+                        other = abs(literal)
+                        if other != var and assignment[other] == (1 if literal > 0 else 0):
+                            breaks[other] -= 1
+                            if not is_touched[other]:
+                                is_touched[other] = 1
+                                touched[touched_count] = other
+                                touched_count += 1
+                            break
+
+            for t in range(touched_count):
+                other = touched[t]
+                is_touched[other] = 0
+                best_bucket = _rebucket(other, make, breaks, offset, buckets, bucket_sizes, bucket_of, bucket_position, best_bucket)
+
+            if satisfied_total == clauses:
+                return True, tries + 1, flips + 1
+
+    return False, max_tries, max_flips
+
+# Whether the solvers should hand their search to the kernels: only when Numba compiled them and
+# the rng is a plain random.Random whose stream the kernels can reproduce
+def kernel_usable(rng):
+    return AVAILABLE and type(rng) is random.Random
+
+# Flat int32 arrays of a ClauseStore, shared with the store without copying
+def store_arrays(store):
+    return (np.frombuffer(store.literals, dtype=np.int32), np.frombuffer(store.offsets, dtype=np.int32),
+            np.frombuffer(store.occurrence_offsets, dtype=np.int32), np.frombuffer(store.occurrence_clauses, dtype=np.int32))
+
+# Runs a kernel on a copy of the rng state and advances the rng past the numbers it drew
+def _run_with_state(rng, kernel, *args):
+    version, internal_state, gauss_next = rng.getstate()
+    state = np.array(internal_state, dtype=np.int64)
+    success, tries, flips = kernel(*args, state)
+    rng.setstate((version, tuple(int(value) for value in state), gauss_next))
+    return bool(success), int(tries), int(flips)
+
+# WalkSAT.solve over a ClauseStore with the kernel
+def walksat_solve(store, rng, max_flips, max_tries, probability):
+    return _run_with_state(rng, _walksat, *store_arrays(store), store.variables,
+                           max_flips, max_tries, probability)
+
+# GSAT.solve over a GSATEngine with the kernel
+def gsat_solve(engine, rng, max_flips, max_tries):
+    occurring_variables = np.array(engine.occurring_variables, dtype=np.int32)
+    return _run_with_state(rng, _gsat, *store_arrays(engine.store), engine.store.variables,
+                           occurring_variables, engine.offset, max_flips, max_tries)
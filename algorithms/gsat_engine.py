@@ -0,0 +1,144 @@
+"""
+Created on Sat Oct 17 11:48:30 2026
+
+@author: Sergio
+"""
+
+from array import array
+
+class GSATEngine:
+    # Keeps make/break counts of every variable and buckets them by net score over a ClauseStore
+    def __init__(self, store):
+        self.store = store
+        size = store.variables + 1
+        self.make = array('i', bytes(4 * size))  # Unsatisfied clauses that a flip would satisfy
+        self.breaks = array('i', bytes(4 * size))  # Satisfied clauses that a flip would break
+        self.satisfied_total = 0
+
+        # Only variables that occur in the formula can change the number of satisfied clauses
+        self.occurring_variables = [var for var in range(1, size)
+                                    if store.occurrences(var) or store.occurrences(-var)]
+        max_degree = max((len(store.occurrences(var)) + len(store.occurrences(-var))
+                          for var in self.occurring_variables), default=0)
+
+        # Bucket b holds the variables whose net score (make - break) is b - offset
+        self.offset = max_degree
+        self.buckets = [[] for _ in range(2 * max_degree + 1)]
+        self.bucket_of = array('i', [-1]) * size
+        self.bucket_position = array('i', [-1]) * size
+        self.best_bucket = 0
+
+    # Rebuilds true counts, make/break counts and buckets for a fresh assignment
+    def reset(self, assignment):
+        store = self.store
+        literals, offsets, true_counts = store.literals, store.offsets, store.true_counts
+        make, breaks = self.make, self.breaks
+        for var in range(len(make)):
+            make[var] = 0
+            breaks[var] = 0
+
+        self.satisfied_total = store.count_true_literals(assignment)
+        for clause in range(store.clauses):
+            count = true_counts[clause]
+            if count == 0:
+                for i in range(offsets[clause], offsets[clause + 1]):
+                    make[abs(literals[i])] += 1
+            elif count == 1:
+                for i in range(offsets[clause], offsets[clause + 1]):
+                    literal = literals[i]
+                    if assignment[abs(literal)] == (literal > 0):
+                        breaks[abs(literal)] += 1
+                        break
+
+        for bucket in self.buckets:
+            bucket.clear()
+        self.best_bucket = 0
+        for var in self.occurring_variables:
+            self.bucket_of[var] = -1
+            self._rebucket(var)
+        return self.satisfied_total
+
+    # Moves a variable to the bucket matching its current net score
+    def _rebucket(self, var):
+        buckets, bucket_of, bucket_position = self.buckets, self.bucket_of, self.bucket_position
+        target = self.make[var] - self.breaks[var] + self.offset
+        current = bucket_of[var]
+        if current == target:
+            return
+        if current >= 0:
+            bucket = buckets[current]
+            last = bucket.pop()
+            if last != var:
+                position = bucket_position[var]
+                bucket[position] = last
+                bucket_position[last] = position
+        bucket = buckets[target]
+        bucket_position[var] = len(bucket)
+        bucket.append(var)
+        bucket_of[var] = target
+        if target > self.best_bucket:
+            self.best_bucket = target
+
+    # Returns the variable with the highest net score, the lowest index among ties like the original GSAT
+    def best_variable(self):
+        buckets = self.buckets
+        while not buckets[self.best_bucket]:
+            self.best_bucket -= 1
+        return min(buckets[self.best_bucket])
+
+    # Flips a variable updating counts only for its neighbours, returns the satisfied total
+    def flip(self, var, assignment):
+        store = self.store
+        literals, offsets, true_counts = store.literals, store.offsets, store.true_counts
+        unsatisfied = store.unsatisfied
+        make, breaks = self.make, self.breaks
+        self.satisfied_total += make[var] - breaks[var]
+
+        true_literal = var if assignment[var] else -var
+        assignment[var] = not assignment[var]
+        touched = {var: None}  # Neighbours to rebucket, in a deterministic (insertion) order
+
+        # Clauses where the literal of var becomes false
+        for clause in store.occurrences(true_literal):
+            count = true_counts[clause] - 1
+            true_counts[clause] = count
+            start, end = offsets[clause], offsets[clause + 1]
+            if count == 0:
+                breaks[var] -= 1
+                for i in range(start, end):
+                    other = abs(literals[i])
+                    make[other] += 1
+                    touched[other] = None
+                unsatisfied.add(clause)
+            elif count == 1:
+                for i in range(start, end):
+                    literal = literals[i]
+                    if assignment[abs(literal)] == (literal > 0):
+                        breaks[abs(literal)] += 1
+                        touched[abs(literal)] = None
+                        break
+
+        # Clauses where the literal of var becomes true
+        for clause in store.occurrences(-true_literal):
+            count = true_counts[clause] + 1
+            true_counts[clause] = count
+            start, end = offsets[clause], offsets[clause + 1]
+            if count == 1:
+                breaks[var] += 1
+                for i in range(start, end):
+                    other = abs(literals[i])
+                    make[other] -= 1
+                    touched[other] = None
+                unsatisfied.remove(clause)
+            elif count == 2:
+                for i in range(start, end):
+                    literal = literals[i]
+                    other = abs(literal)
+                    if other != var and assignment[other] == (literal > 0):
+                        breaks[other] -= 1
+                        touched[other] = None
+                        break
+
+        for other in touched:
+            self._rebucket(other)
+        return self.satisfied_total
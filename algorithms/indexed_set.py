@@ -0,0 +1,45 @@
+"""
+Created on Sat Oct 17 11:02:15 2026
+
+@author: Sergio
+"""
+
+from array import array
+
+class IndexedSet:
+    # Set of integers in [0, size) with O(1) add, remove and uniform random selection
+    def __init__(self, size):
+        self.items = []  # Members in arbitrary order, random.choice(self.items) picks uniformly
+        self.positions = array('i', [-1]) * size  # Index of each member inside items, -1 if absent
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return self.positions[item] >= 0
+
+    def __iter__(self):
+        return iter(self.items)
+
+    # Appends an item at the end of the array
+    def add(self, item):
+        if self.positions[item] < 0:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    # Removes an item by moving the last member into its slot
+    def remove(self, item):
+        position = self.positions[item]
+        if position < 0:
+            return
+        last = self.items.pop()
+        if last != item:
+            self.items[position] = last
+            self.positions[last] = position
+        self.positions[item] = -1
+
+    # Empties the set touching only its current members
+    def clear(self):
+        for item in self.items:
+            self.positions[item] = -1
+        self.items.clear()
@@ -0,0 +1,101 @@
+"""
+Created on Sat Oct 17 12:35:09 2026
+
+@author: Sergio
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+CACHE_DIR = os.path.join("data", "cache", "instances")  # Relative to the repo root, like ./generator
+CACHE_MAX_BYTES = 1 << 30  # Least recently used entries are evicted above this size
+CACHE_ENABLED = True
+EVICTION_INTERVAL = 32  # Saves between two scans of the cache directory
+
+_saves_since_eviction = 0
+
+# Content address of an instance: hash of the generator name and its parameters
+def instance_key(generator, **params):
+    description = json.dumps({"generator": generator, **params}, sort_keys=True)
+    return hashlib.sha1(description.encode("utf-8")).hexdigest()
+
+def _entry_path(key, kind):
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.{kind}.npy")
+
+# Loads a cached int32 array (None on miss) and marks it as recently used
+def load_array(key, kind):
+    if not CACHE_ENABLED:
+        return None
+    path = _entry_path(key, kind)
+    try:
+        values = np.load(path, allow_pickle=False)
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return values
+
+# Stores an int32 array atomically so concurrent workers never read partial files
+def save_array(key, kind, values):
+    if not CACHE_ENABLED:
+        return
+    path = _entry_path(key, kind)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            np.save(file, np.asarray(values, dtype=np.int32), allow_pickle=False)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return
+
+    global _saves_since_eviction
+    _saves_since_eviction += 1
+    if _saves_since_eviction >= EVICTION_INTERVAL:
+        _saves_since_eviction = 0
+        evict(CACHE_MAX_BYTES)
+
+# Formula as a list of clauses (lists of literals), or None if not cached
+def load_formula(key):
+    values = load_array(key, "formula")
+    return None if values is None else values.tolist()
+
+def save_formula(key, formula):
+    save_array(key, "formula", formula)
+
+# Community of every variable (1..n) as computed by the partition method, or None if not cached
+def load_partition(key, method="louvain"):
+    values = load_array(key, method)
+    return None if values is None else values.tolist()
+
+def save_partition(key, partition, method="louvain"):
+    save_array(key, method, partition)
+
+# Removes least recently used entries until the cache fits in max_bytes
+def evict(max_bytes):
+    entries = []
+    total = 0
+    for root, _, files in os.walk(CACHE_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+    if total <= max_bytes:
+        return
+    for _, size, path in sorted(entries):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
@@ -0,0 +1,82 @@
+"""
+Created on Sat Oct 17 13:20:52 2026
+
+@author: Sergio
+"""
+
+import numpy as np
+
+# Ports of generator/communityAttachment (randomkCNF.cpp and communityAttachment.cpp) to NumPy.
+# Both follow the same models as the C++ programs but draw from a NumPy Generator, so a given
+# seed yields a different (equally distributed) instance than the external executables.
+
+# Redraws the variables of every row that repeats a variable until all clauses are tautology free
+def _resample_repeated(variables, draw):
+    while True:
+        ordered = np.sort(np.abs(variables), axis=1)
+        repeated = np.flatnonzero((ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+        if repeated.size == 0:
+            return variables
+        variables[repeated] = draw(repeated)
+
+# Random polarity for every literal
+def _apply_signs(variables, rng):
+    signs = np.where(rng.random(variables.shape) < 0.5, -1, 1)
+    return (variables * signs).astype(np.int32)
+
+# Classical random k-CNF: m clauses of k distinct variables chosen uniformly among n
+def random_kcnf(n, m, k, seed):
+    if k < 1 or k > n:
+        raise ValueError(f"k must be in [1, n] (k={k}, n={n})")
+    rng = np.random.default_rng(seed)
+    variables = rng.integers(1, n + 1, size=(m, k))
+    variables = _resample_repeated(variables, lambda rows: rng.integers(1, n + 1, size=(rows.size, k)))
+    return _apply_signs(variables, rng)
+
+# Ground-truth partition of the community attachment model: community of variable v at index v-1
+def community_partition(n, c):
+    bounds = np.arange(c + 1) * n // c
+    return np.repeat(np.arange(c, dtype=np.int32), np.diff(bounds))
+
+# Community attachment model: returns the clauses (m, k) and the community of every variable
+def community_attachment(n, m, k, c, Q, seed):
+    if c <= 1:
+        raise ValueError("c must be greater than 1")
+    if not 0 < Q < 1:
+        raise ValueError("Q must be in the interval (0,1)")
+    if k < 2:
+        raise ValueError("k must be greater than 1")
+    if c < k:
+        raise ValueError(f"c (c={c}) must be greater or equal than k (k={k})")
+    if c * k > n:
+        raise ValueError(f"c*k (c={c}, k={k}) must be less or equal than n (n={n})")
+
+    rng = np.random.default_rng(seed)
+    probability = Q + 1 / c  # Probability that all the literals of a clause share a community
+
+    # Community of every literal: one shared community or k distinct ones
+    same = rng.random(m) <= probability
+    communities = np.empty((m, k), dtype=np.int64)
+    communities[same] = rng.integers(0, c, size=(int(same.sum()), 1))
+    mixed = np.flatnonzero(~same)
+    communities[mixed] = rng.integers(0, c, size=(mixed.size, k))
+    communities[mixed] = _resample_repeated(communities[mixed],
+                                            lambda rows: rng.integers(0, c, size=(rows.size, k)))
+
+    # Variable of every literal drawn uniformly inside its community
+    starts = np.arange(c) * n // c
+    sizes = (np.arange(1, c + 1) * n // c) - starts
+
+    def draw(rows):
+        row_communities = communities[rows]
+        return starts[row_communities] + (rng.random(row_communities.shape) * sizes[row_communities]).astype(np.int64) + 1
+
+    variables = _resample_repeated(draw(np.arange(m)), draw)
+    return _apply_signs(variables, rng), community_partition(n, c)
+
+# Writes clauses in DIMACS format, the input expected by graph_features_sat (features_s)
+def write_dimacs(path, clauses, variables):
+    with open(path, "w") as file:
+        file.write(f"p cnf {variables} {len(clauses)}\n")
+        for clause in clauses:
+            file.write(" ".join(map(str, clause)) + " 0\n")
@@ -0,0 +1,265 @@
+"""
+Created on Sat Oct 17 19:40:18 2026
+
+@author: Sergio
+"""
+
+from abc import ABC, abstractmethod
+import subprocess
+import random
+import tempfile
+import os
+import shutil
+
+from algorithms.clause_store import ClauseStore
+from algorithms.community_selector import DominantCommunityPool
+from algorithms.flip_kernel import kernel_usable, walksat_solve
+from algorithms.instance_cache import instance_key, load_formula, save_formula, load_partition, save_partition
+from algorithms.instance_generator import random_kcnf, community_attachment, write_dimacs
+
+class LocalSearch(ABC):
+    # Shared core of every solver: instance loading, the ClauseStore search state (assignment,
+    # true counts, unsatisfied set, occurrence lists) and the try/flip loop. Solvers customise
+    # it through the reset, flip and select_variable hooks.
+    HOOKS = ('random_assignment', 'reset', 'flip', 'select_variable')  # Methods the try/flip loop calls
+
+    def __init__(self, variables, clauses, clauseLength, seed, generator='external', rng=None):
+        self.variables = variables  # Number of variables in the formula
+        self.clauses = clauses  # Number of clauses in the formula
+        self.clauseLength = clauseLength  # Number of literals per clause
+        self.seed = seed  # Seed of the instance, and of the search unless rng is given
+        self.rng = rng if rng is not None else random.Random(seed)  # Search randomness, isolated from the global random module
+        self.generator = generator  # 'external' runs ./generator/communityAttachment, 'native' the NumPy port
+        self.store = ClauseStore(self.generate_random_model(), variables)  # Flat clause store shared by the search
+
+    # Generates a random SAT model with the selected generator, reusing cached instances
+    def generate_random_model(self):
+        key = instance_key('random' if self.generator == 'external' else 'random_native',
+                           n=self.variables, m=self.clauses, k=self.clauseLength, seed=self.seed)
+        formula = load_formula(key)
+        if formula is not None:
+            return formula
+
+        if self.generator == 'native':
+            formula = random_kcnf(self.variables, self.clauses, self.clauseLength, self.seed).tolist()
+            save_formula(key, formula)
+            return formula
+
+        temp_dir = tempfile.mkdtemp()
+        file_formula = os.path.join(temp_dir, "random_formula.txt")
+        try:
+            path_generator_model = "./generator/communityAttachment/random"  # Path to the external model generator
+            arguments = ['-n', str(self.variables), '-m', str(self.clauses),
+                        '-k', str(self.clauseLength), '-s', str(self.seed)]
+            process = subprocess.Popen([path_generator_model] + arguments, stdout=subprocess.PIPE)
+            output, _ = process.communicate()
+            decoded_output = output.decode("utf-8")
+            with open(file_formula, "w") as file:
+                file.write(decoded_output)
+            formula = [[int(value) for value in line.split()[:-1]] for line in decoded_output.splitlines()[6:]]
+            save_formula(key, formula)
+            return formula
+        finally:
+            shutil.rmtree(temp_dir)
+
+    # Draws a fresh assignment; index 0 is unused so variables index it directly
+    def random_assignment(self):
+        return bytearray([False] + [self.rng.choice([True, False]) for _ in range(self.variables)])
+
+    # Hook: rebuilds the search state for a fresh assignment, returns the satisfied total
+    def reset(self, assignment):
+        return self.store.count_true_literals(assignment)
+
+    # Hook: flips var updating the search state, returns the satisfied total
+    def flip(self, var, assignment):
+        return self.store.flip(var, assignment)
+
+    # Hook: variable to flip next
+    @abstractmethod
+    def select_variable(self, assignment, probability):
+        pass
+
+    # Whether solve() can hand the search to kernel_solve, the Numba kernel of the class that defines
+    # it: the kernels are compiled, the rng is one they reproduce and no subclass changed the hooks
+    # the kernel was written for
+    def kernel_applies(self):
+        owner = next((cls for cls in type(self).__mro__ if 'kernel_solve' in vars(cls)), None)
+        if owner is None or not kernel_usable(self.rng):
+            return False
+        return all(getattr(type(self), hook) is getattr(owner, hook) for hook in self.HOOKS)
+
+    # Main method to attempt solving the SAT problem, allowing flips and retries
+    def solve(self, max_flips, max_tries, probability=None):
+        if self.kernel_applies():  # Same search compiled with Numba, same results for the same rng
+            return self.kernel_solve(max_flips, max_tries, probability)
+
+        for tries in range(max_tries):
+            assignment = self.random_assignment()
+
+            satisfied_total = self.reset(assignment)
+
+            if satisfied_total == self.clauses:
+                return True, tries+1, 1
+
+            for flips in range(max_flips):
+                var = self.select_variable(assignment, probability)
+                satisfied_total = self.flip(var, assignment)
+
+                if satisfied_total == self.clauses:
+                    return True, tries+1, flips+1
+
+        return False, max_tries, max_flips
+
+class WalkSATSearch(LocalSearch):
+    # WalkSAT step: pick an unsatisfied clause and flip a variable of it that breaks no clause,
+    # otherwise, with the noise probability a random one and else the one that breaks fewest
+    HOOKS = LocalSearch.HOOKS + ('select_clause', 'penalty', 'noise_variable')
+
+    # Hook: unsatisfied clause (0-based) to repair
+    def select_clause(self):
+        return self.rng.choice(self.store.unsatisfied.items)
+
+    # Hook: extra cost added to the break count of a candidate that breaks some clause
+    def penalty(self, var):
+        return 0
+
+    # Hook: variable of the clause flipped by a noise step
+    def noise_variable(self, candidates):
+        return abs(self.rng.choice(candidates))
+
+    def select_variable(self, assignment, probability):
+        store = self.store
+        best_var = None
+        best_break_count = float('inf')
+        candidates = store.clause_literals(self.select_clause())
+
+        for literal in candidates:
+            var = abs(literal)
+            break_count = store.break_count(var, assignment)
+
+            if break_count == 0:
+                return var
+
+            effective_break = break_count + self.penalty(var)
+            if effective_break < best_break_count:
+                best_break_count = effective_break
+                best_var = var
+
+        if self.rng.random() < probability:
+            return self.noise_variable(candidates)
+        return best_var
+
+    # The plain WalkSAT search with the flip kernel
+    def kernel_solve(self, max_flips, max_tries, probability):
+        return walksat_solve(self.store, self.rng, max_flips, max_tries, probability)
+
+class CommunityWalkSAT(WalkSATSearch):
+    # WalkSAT over a community attachment instance and its partition into communities
+    def __init__(self, variables, clauses, clauseLength, seed, modularity, communities, generator='external', partition='louvain', rng=None):
+        self.modularity = modularity
+        self.communities = communities
+        self.partition = partition  # 'louvain' detects communities with features_s, 'ground_truth' uses the generator's
+        super().__init__(variables, clauses, clauseLength, seed, generator, rng)
+
+    # Builds the community model, reusing the cached formula and partition when available
+    def generate_random_model(self):
+        key = instance_key('commAttach' if self.generator == 'external' else 'commAttach_native', n=self.variables, m=self.clauses, k=self.clauseLength,
+                           c=self.communities, Q=self.modularity, seed=self.seed)
+        formula = load_formula(key)
+        partition = load_partition(key, self.partition)
+        if formula is None or partition is None:
+            formula, partition = self.run_generator()
+            save_formula(key, formula)
+            save_partition(key, partition, self.partition)
+
+        community_to_vars = {}
+        for var, community in enumerate(partition, start=1):
+            if community not in community_to_vars:
+                community_to_vars[community] = []
+            community_to_vars[community].append(var)
+
+        self.variable_to_community = {var: community for community, vars_list in community_to_vars.items() if len(vars_list) > 1 for var in vars_list}
+
+        self.clause_community_count = []
+        for clause in formula:
+            community_count = {}
+            for var in clause:
+                var_abs = abs(var)
+                if var_abs in self.variable_to_community:
+                    community = self.variable_to_community[var_abs]
+                    if community in community_count:
+                        community_count[community] += 1
+                    else:
+                        community_count[community] = 1
+            self.clause_community_count.append(community_count)
+
+        return formula
+
+    # Generates a community formula and its partition (generator ground truth or Louvain with features_s)
+    def run_generator(self):
+        temp_dir = tempfile.mkdtemp()
+        file_formula = os.path.join(temp_dir, "community_formula.txt")
+        file_communities = os.path.join(temp_dir, "communities.txt")
+
+        try:
+            if self.generator == 'native':
+                clauses, ground_truth = community_attachment(self.variables, self.clauses, self.clauseLength,
+                                                             self.communities, self.modularity, self.seed)
+                formula = clauses.tolist()
+                if self.partition == 'ground_truth':
+                    return formula, ground_truth.tolist()
+                write_dimacs(file_formula, formula, self.variables)
+            else:
+                path_generator_model = "./generator/communityAttachment/commAttach"
+                arguments = ['-n', str(self.variables), '-m', str(self.clauses),
+                            '-k', str(self.clauseLength), '-c', str(self.communities),
+                            '-Q', str(self.modularity), '-s', str(self.seed)]
+                if self.partition == 'ground_truth':
+                    arguments += ['-g', file_communities]
+
+                process = subprocess.Popen(
+                    [path_generator_model] + arguments, stdout=subprocess.PIPE)
+                output, _ = process.communicate()
+                decoded_output = output.decode("utf-8")
+
+                with open(file_formula, "w") as file:
+                    file.write(decoded_output)
+
+                formula = [[int(value) for value in line.split()[:-1]]
+                        for line in decoded_output.splitlines()[8:]]
+
+            if self.partition == 'louvain':
+                path_features_s = "./generator/graph_features_sat_v_2_2/features_s"
+                arguments = ["-5", "-q", file_communities, file_formula]
+                process = subprocess.Popen(
+                    [path_features_s] + arguments, stdout=subprocess.PIPE)
+                output, _ = process.communicate()
+
+            with open(file_communities, "r") as file:
+                partition = [int(line.strip()) for line in file]
+
+            return formula, partition
+
+        finally:
+            shutil.rmtree(temp_dir)
+
+class DominantCommunityWalkSAT(CommunityWalkSAT):
+    # Repairs first the unsatisfied clauses whose dominant community has dominant_size variables
+    dominant_size = None
+
+    def __init__(self, variables, clauses, clauseLength, seed, modularity, communities, generator='external', partition='louvain', rng=None):
+        super().__init__(variables, clauses, clauseLength, seed, modularity, communities, generator, partition, rng)
+        # Unsatisfied clauses with dominant_size variables of the same community, picked first
+        self.priority = DominantCommunityPool(self.store, self.clause_community_count, self.dominant_size)
+
+    def reset(self, assignment):
+        return self.priority.reset(assignment)
+
+    def flip(self, var, assignment):
+        return self.priority.flip(var, assignment)
+
+    # Uniform clause of the priority pool if it has any, otherwise of all the unsatisfied ones
+    def select_clause(self):
+        if self.priority:
+            return self.rng.choice(self.priority.clauses.items)
+        return self.rng.choice(self.store.unsatisfied.items)
@@ -0,0 +1,71 @@
+"""
+Created on Sat Oct 17 19:02:11 2026
+
+@author: Sergio
+"""
+
+import importlib
+
+class SolverSpec:
+    # A solver class, imported on first use, and the parameters it is built and run with
+    def __init__(self, module, attribute, model='random', noise=True, batch=False):
+        self.module = module  # Module that defines the solver, only imported when a solver is built
+        self.attribute = attribute  # Class (or factory function) inside the module
+        self.model = model  # 'random' instances take n, m and k; 'community' ones also Q, c and the partition
+        self.noise = noise  # solve() takes the noise probability p
+        self.batch = batch  # Plain WalkSAT search that BatchWalkSAT can run in lockstep
+        self._factory = None
+
+    # Imports the module of the solver the first time it is needed
+    def load(self):
+        if self._factory is None:
+            self._factory = getattr(importlib.import_module(self.module), self.attribute)
+        return self._factory
+
+    # Constructor arguments of the solver for one seed of a configuration
+    def arguments(self, config_params, seed, rng=None):
+        arguments = {
+            'variables': config_params['n'],
+            'clauses': int(config_params['m_n'] * config_params['n']),
+            'clauseLength': config_params['k'],
+            'seed': seed,
+            'rng': rng,
+            'generator': config_params.get('generator', 'external'),
+        }
+        if self.model == 'community':
+            arguments.update({
+                'modularity': config_params['Q'],
+                'communities': config_params['c'],
+                'partition': config_params.get('partition', 'louvain'),
+            })
+        return arguments
+
+    # Builds the solver (and its instance) of one seed of a configuration
+    def build(self, config_params, seed, rng=None):
+        return self.load()(**self.arguments(config_params, seed, rng))
+
+    # Runs the search of a built solver with the limits of the configuration, returns (success, tries, flips)
+    def solve(self, solver, config_params):
+        arguments = {'max_flips': config_params['max_flips'], 'max_tries': config_params['max_tries']}
+        if self.noise:
+            arguments['probability'] = config_params.get('p')
+        return solver.solve(**arguments)
+
+# Solvers by name, new engines are plugged in with a register() call below
+SOLVERS = {}
+
+# Adds (or replaces) a solver of the registry
+def register(name, module, attribute, model='random', noise=True, batch=False):
+    SOLVERS[name] = SolverSpec(module, attribute, model, noise, batch)
+
+# Specification of a registered solver
+def get_solver(name):
+    if name not in SOLVERS:
+        raise ValueError(f"Unknown solver {name}, registered solvers: {', '.join(SOLVERS)}")
+    return SOLVERS[name]
+
+register('WalkSAT_random', 'algorithms.WalkSAT', 'WalkSAT', batch=True)
+register('GSAT', 'algorithms.GSAT', 'GSAT', noise=False)
+register('WalkSAT_community_v00', 'algorithms.WalkSAT_v00', 'WalkSAT', model='community', batch=True)
+for version in ('v01', 'v02', 'v03', 'v04', 'v05'):
+    register(f'WalkSAT_community_{version}', f'algorithms.WalkSAT_{version}', 'WalkSAT', model='community')
@@ -0,0 +1,48 @@
+"""
+Created on Sat Oct 17 18:02:44 2026
+
+@author: Sergio
+"""
+
+from array import array
+
+class SumTree:
+    # Non-negative weights of the items [0, size) with O(log size) updates and weighted sampling
+    def __init__(self, size):
+        self.leaves = 1
+        while self.leaves < size:
+            self.leaves *= 2
+        # Node i holds the sum of its children 2i and 2i+1, the weight of item j is at leaves + j
+        self.tree = array('d', bytes(8 * 2 * self.leaves))
+
+    # Sum of all the weights
+    def total(self):
+        return self.tree[1]
+
+    # Sets the weight of an item, recomputing its ancestors from their children so no rounding accumulates
+    def update(self, item, weight):
+        tree = self.tree
+        node = self.leaves + item
+        tree[node] = weight
+        node //= 2
+        while node:
+            tree[node] = tree[2 * node] + tree[2 * node + 1]
+            node //= 2
+
+    # Item whose cumulative weight interval contains value, for value in [0, total())
+    def find(self, value):
+        tree = self.tree
+        node = 1
+        while node < self.leaves:
+            left = 2 * node
+            # Items of zero weight are never returned, even if value hits a boundary after rounding
+            if value < tree[left] or tree[left + 1] <= 0:
+                node = left
+            else:
+                value -= tree[left]
+                node = left + 1
+        return node - self.leaves
+
+    # Draws an item with probability proportional to its weight
+    def sample(self, rng):
+        return self.find(rng.random() * self.tree[1])
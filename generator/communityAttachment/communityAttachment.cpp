@@ -43,6 +43,7 @@ int c = 80;		// number of communities
 double P;
 
 char* output = NULL;
+char* partitionOutput = NULL;	// ground-truth communities file
 
 void printUsage(char* app){
 	cerr << "  Usage: " << app << " [options]" << endl;
@@ -53,6 +54,7 @@ void printUsage(char* app){
 	cerr << "    -k <int>   :  number of literals by clause: k-CNF (3)" << endl;
 	cerr << "    -s <int>   :  seed (0)" << endl;
 	cerr << "    -o <string>:  output file (stdout)" << endl;
+	cerr << "    -g <string>:  ground-truth communities output file (none)" << endl;
 	cerr << "  Restrictions:" << endl;
 	cerr << "    1. c must be greater than 1" << endl;
 	cerr << "    2. Q must be in the interval (0,1)" << endl;
@@ -64,7 +66,7 @@ void printUsage(char* app){
 
 void parseArgs(int argc, char **argv){
 	int opt;
-	while((opt=getopt(argc, argv, "n:m:c:Q:s:k:?ho:")) != -1){
+	while((opt=getopt(argc, argv, "n:m:c:Q:s:k:?ho:g:")) != -1){
 		switch(opt){
 			case 'n':
 				n = atoi(optarg);
@@ -102,6 +104,9 @@ void parseArgs(int argc, char **argv){
 			case 'o':
 				output = optarg;
 				break;
+			case 'g':
+				partitionOutput = optarg;
+				break;
 			case 'h':
 			case '?':
 				printUsage(argv[0]);
@@ -130,6 +135,16 @@ void computeProbability(){
 		
 }
 
+// Write the community of each variable (one line per variable, as features_s -5)
+void printPartition(){
+	FILE *fpart = fopen(partitionOutput, "w");
+	for(int j=0; j<c; j++){
+		for(int var=j*n/c+1; var<=(j+1)*n/c; var++)
+			fprintf(fpart, "%d\n", j);
+	}
+	fclose(fpart);
+}
+
 void computeN2C(vector<int> &n2c){
 	int rn;
 	double rd;
@@ -257,4 +272,8 @@ int main(int argc, char **argv){
 	if(output!=NULL){
 		fclose(fout);
 	}
+	
+	if(partitionOutput!=NULL){
+		printPartition();
+	}
 }
\ No newline at end of file
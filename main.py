@@ -18,8 +18,17 @@ def main():
             "max_flips_coef_values": [10],
             "max_flips_values": None,
             "m_n_ratios": np.arange(2.5, 5.5, 0.1),
+            "sweep": "grid", # grid (every m/n ratio), adaptive (coarse grid refined where success crosses 50%)
+            "coarse_stride": 5, # adaptive sweep: one of every coarse_stride ratios in the first round
             "num_seeds": 100,
-            "algorithm_type": "WalkSAT_community" # GSAT, WalkSAT_community, WalkSAT_random
+            "ci_width": None, # None runs every seed; e.g. 10 stops once the 95% CI of the success rate is narrower than 10 points
+            "min_seeds": 20,
+            "master_seed": 0, # seeds and solver randomness are derived from it and each configuration
+            "algorithm_type": "WalkSAT_community", # GSAT, WalkSAT_community, WalkSAT_random
+            "solver": "WalkSAT_community_v01", # name in algorithms/registry.py: WalkSAT_random, GSAT, WalkSAT_community_v00 ... v05
+            "generator": "external", # external (C++ executables), native (NumPy port)
+            "partition": "louvain", # louvain (features_s), ground_truth (communities assigned by the generator)
+            "engine": "python" # python (one seed at a time), batch (NumPy lockstep walks, WalkSAT_random and v00 only)
         },
     ]
 
@@ -51,7 +60,16 @@ def main():
             max_flips_coef_values=exp_config.get("max_flips_coef_values"),
             m_n_ratios=exp_config["m_n_ratios"],
             num_seeds=exp_config["num_seeds"],
-            algorithm_type=exp_config["algorithm_type"]
+            algorithm_type=exp_config["algorithm_type"],
+            generator=exp_config.get("generator", "external"),
+            partition=exp_config.get("partition", "louvain"),
+            ci_width=exp_config.get("ci_width"),
+            min_seeds=exp_config.get("min_seeds", 20),
+            sweep=exp_config.get("sweep", "grid"),
+            coarse_stride=exp_config.get("coarse_stride", 5),
+            master_seed=exp_config.get("master_seed", 0),
+            engine=exp_config.get("engine", "python"),
+            solver=exp_config.get("solver")
         )
 
 
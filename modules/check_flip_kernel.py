@@ -0,0 +1,52 @@
+"""
+Created on Sat Oct 17 20:31:47 2026
+
+@author: Sergio
+"""
+
+import random
+import sys
+
+from algorithms import flip_kernel
+from algorithms.registry import SOLVERS
+
+# Checks the Numba flip kernels against the Python search: every registered solver runs the same
+# instances and rng with the kernels enabled and disabled, and must return the same results and
+# leave its rng in the same state (solvers the kernels do not apply to must keep their own search).
+# Without Numba the kernels run unjitted, which checks the same code.
+#     python -m modules.check_flip_kernel [seeds]
+CONFIG = {'n': 50, 'k': 3, 'max_flips': 500, 'max_tries': 3, 'p': 0.5, 'c': 10, 'Q': 0.8,
+          'generator': 'native', 'partition': 'ground_truth'}
+M_N_RATIOS = [3.5, 4.0, 4.3, 4.6]
+
+# Result of one search and the state it leaves its rng in, with the kernels enabled or not
+def run_search(spec, config_params, seed, kernel):
+    flip_kernel.AVAILABLE = kernel
+    rng = random.Random(seed)
+    result = spec.solve(spec.build(config_params, seed, rng), config_params)
+    return result, rng.getstate()
+
+# Number of searches whose kernel and Python runs differ
+def check_solvers(seeds):
+    compiled = flip_kernel.AVAILABLE
+    mismatches = 0
+    try:
+        for name, spec in SOLVERS.items():
+            for m_n in M_N_RATIOS:
+                config_params = {**CONFIG, 'm_n': m_n}
+                for seed in range(seeds):
+                    kernel = run_search(spec, config_params, seed, True)
+                    python = run_search(spec, config_params, seed, False)
+                    if kernel != python:
+                        mismatches += 1
+                        print(f"{name}, m/n={m_n}, seed={seed}: kernel {kernel[0]}, Python {python[0]}")
+    finally:
+        flip_kernel.AVAILABLE = compiled
+    return mismatches
+
+if __name__ == "__main__":
+    seeds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    mismatches = check_solvers(seeds)
+    kernels = 'Numba' if flip_kernel.AVAILABLE else 'unjitted'
+    print(f"{mismatches} mismatches between the {kernels} kernels and the Python search")
+    sys.exit(1 if mismatches else 0)
@@ -4,103 +4,153 @@ Módulo mejorado para ejecutar experimentos con WalkSAT en paralelo
 """
 
 import os
+import math
+import bisect
 import time
 import random
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
-from algorithms.WalkSAT import WalkSAT as WalkSAT_random
-from algorithms.WalkSAT_v00 import WalkSAT as WalkSAT_community_v00
-from algorithms.WalkSAT_v01 import WalkSAT as WalkSAT_community_v01
-from algorithms.WalkSAT_v02 import WalkSAT as WalkSAT_community_v02
-from algorithms.WalkSAT_v03 import WalkSAT as WalkSAT_community_v03
-from algorithms.WalkSAT_v04 import WalkSAT as WalkSAT_community_v04
-from algorithms.WalkSAT_v05 import WalkSAT as WalkSAT_community_v05
-from algorithms.GSAT import GSAT
-from datetime import datetime
+from algorithms.registry import get_solver
+from algorithms.batch_walksat import BatchWalkSAT, clause_matrix
+from modules.results_store import ResultsStore, import_results_txt, report_results, store_path, write_report
 from tqdm import tqdm
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 import multiprocessing
 import warnings
 warnings.filterwarnings('ignore')
 
 # Global constants
 MAX_WORKERS = max(1, multiprocessing.cpu_count() - 2)
-CHUNK_SIZE = 10
+MAX_IN_FLIGHT = 2 * MAX_WORKERS  # Seed batches queued in the pool at any time
+SEED_BATCH_WORK = 5_000_000  # Target n * max_flips * max_tries covered by one seed batch
+ADAPTIVE_SEED_BATCH = 5  # Largest seed batch when seeds are sampled adaptively
+BATCH_ENGINE_WALKS = 100  # Seeds run together by the batch engine
+CONFIDENCE_Z = 1.96  # Normal quantile of the 95% interval used for early stopping
+PHASE_TRANSITION_RATIO = 4.26  # m/n where random 3-SAT is hardest and most seeds exhaust max_flips
 MAX_RETRIES = 3
 
-# Execute experiments in parallel with a maximum number of retries
-def run_single_configuration(config_params, num_seeds=100, algorithm_type='WalkSAT_community', experiment_name='WalkSAT_community'):
-    for attempt in range(MAX_RETRIES):
-        results = {
-            'success_count': 0,
-            'total_flips': 0,
-            'start_time': time.time()
-        }
-        
-        seeds = random.sample(range(1001), num_seeds)
-        for seed in seeds:
-            if algorithm_type == 'WalkSAT_community':
-                if "v00" in experiment_name:
-                    solver_class = WalkSAT_community_v00
-                elif "v01" in experiment_name:
-                    solver_class = WalkSAT_community_v01
-                elif "v02" in experiment_name:
-                    solver_class = WalkSAT_community_v02
-                elif "v03" in experiment_name:
-                    solver_class = WalkSAT_community_v03
-                elif "v04" in experiment_name:
-                    solver_class = WalkSAT_community_v04
-                elif "v05" in experiment_name:
-                    solver_class = WalkSAT_community_v05
-                else:
-                    solver_class = WalkSAT_community_v00
-
-                solver = solver_class(
-                    variables=config_params['n'],
-                    clauses=int(config_params['m_n'] * config_params['n']),
-                    clauseLength=config_params['k'],
-                    seed=seed,
-                    modularity=config_params['Q'],
-                    communities=config_params['c']
-                )
-                success, tries, flips = solver.solve(
-                max_flips=config_params['max_flips'],
-                max_tries=config_params['max_tries'],
-                probability=config_params['p'] if 'p' in config_params else None 
-            )
-            elif algorithm_type == 'WalkSAT_random':
-                solver = WalkSAT_random(
-                    variables=config_params['n'],
-                    clauses=int(config_params['m_n'] * config_params['n']),
-                    clauseLength=config_params['k'],
-                    seed=seed
-                )
-                success, tries, flips = solver.solve(
-                max_flips=config_params['max_flips'],
-                max_tries=config_params['max_tries'],
-                probability=config_params['p'] if 'p' in config_params else None 
-            )
-            else:
-                solver = GSAT(
-                    variables=config_params['n'],
-                    clauses=int(config_params['m_n'] * config_params['n']),
-                    clauseLength=config_params['k'],
-                    seed=seed
-                )
-                success, tries, flips = solver.solve(
-                    max_flips=config_params['max_flips'],
-                    max_tries=config_params['max_tries'],
-                )
-            
-            if success:
-                results['success_count'] += 1
-            results['total_flips'] += flips * tries
-        
-        results['success_rate'] = (results['success_count'] / num_seeds) * 100
-        results['execution_time'] = time.time() - results['start_time']
-        return results
+# Registry name of the solver of an experiment. WalkSAT_random and GSAT are solvers of their own;
+# for WalkSAT_community the solver should be given explicitly, picking the variant tagged (v00-v05)
+# in the experiment name is only kept (deprecated) for experiments configured before the registry
+def resolve_solver(algorithm_type, experiment_name, solver=None):
+    if solver is not None:
+        return solver
+    if algorithm_type != 'WalkSAT_community':
+        return algorithm_type
+    solver = 'WalkSAT_community_v00'
+    for version in ("v01", "v02", "v03", "v04", "v05"):
+        if version in experiment_name:
+            solver = f'WalkSAT_community_{version}'
+            break
+    print(f"\nDeprecated: no solver given, running {solver} picked from the experiment name {experiment_name}; "
+          f"set solver='{solver}' explicitly")
+    return solver
+
+# Build the solver (and its instance) of one seed of a configuration
+def build_solver(config_params, seed, rng=None):
+    return get_solver(config_params['solver']).build(config_params, seed, rng)
+
+# Run a single seed of a configuration and return its outcome
+def run_seed(config_params, seed, rng=None):
+    start_time = time.time()
+    spec = get_solver(config_params['solver'])
+    success, tries, flips = spec.solve(spec.build(config_params, seed, rng), config_params)
+
+    return {
+        'seed': seed,
+        'success': success,
+        'tries': tries,
+        'flips': flips,
+        'time': time.time() - start_time
+    }
+
+# Run all the seeds of a batch together as lockstep walks of BatchWalkSAT; the batch time is
+# shared equally among its seeds. The walks share one generator, derived from the configuration
+# key and the seeds of the batch so every batch of a configuration draws its own numbers
+def run_batch_engine(config_params, seeds, rng_key=None):
+    start_time = time.time()
+    formulas = [clause_matrix(build_solver(config_params, seed).store) for seed in seeds]
+    entropy = list(seeds) if rng_key is None else [random.Random(rng_key).getrandbits(64), *seeds]
+    rng = np.random.default_rng(entropy)
+    outcomes = BatchWalkSAT(formulas, config_params['n'], rng).solve(
+        max_flips=config_params['max_flips'],
+        max_tries=config_params['max_tries'],
+        probability=config_params['p']
+    )
+    elapsed = (time.time() - start_time) / len(seeds)
+    return [{'seed': seed, 'success': success, 'tries': tries, 'flips': flips, 'time': elapsed}
+            for seed, (success, tries, flips) in zip(seeds, outcomes)]
+
+# Run a batch of seeds of one configuration inside a worker; the search of every seed draws from
+# its own generator derived from the configuration key, so results do not depend on scheduling
+def run_seed_batch(config_params, seeds, rng_key=None):
+    if config_params.get('engine') == 'batch':
+        return run_batch_engine(config_params, seeds, rng_key)
+    return [run_seed(config_params, seed, rng=random.Random(f"{rng_key}:{seed}") if rng_key is not None else None)
+            for seed in seeds]
+
+# Instance seeds of a configuration in a reproducible order derived from the master seed and the
+# instance parameters only: configurations that differ in p, max_tries or max_flips solve the same
+# instances, so they are generated (and cached) once
+def configuration_seeds(master_seed, config_params):
+    instance = (config_params['n'], int(config_params['m_n'] * config_params['n']), config_params['k'],
+                config_params.get('c'), config_params.get('Q'))
+    return random.Random(f"{master_seed}:{instance}").sample(range(1001), 1001)
+
+# Reduce per-seed outcomes to the aggregates stored for a configuration
+def aggregate_seed_results(seed_results):
+    success_count = sum(1 for result in seed_results if result['success'])
+    return {
+        'seeds': len(seed_results),
+        'success_count': success_count,
+        'total_flips': sum(result['flips'] * result['tries'] for result in seed_results),
+        'success_rate': (success_count / len(seed_results)) * 100,
+        'execution_time': sum(result['time'] for result in seed_results)
+    }
+
+# Width (in percentage points) of the Wilson score interval of the success rate
+def wilson_interval_width(successes, trials, z=CONFIDENCE_Z):
+    if trials == 0:
+        return 100.0
+    rate = successes / trials
+    spread = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials))
+    return 200 * spread / (1 + z * z / trials)
+
+# Adaptive sampling: the success rate is known precisely enough to stop drawing seeds.
+# The Wilson interval stays wide for all-0/all-100 samples until enough seeds agree.
+def is_precise_enough(seed_results, ci_width, min_seeds):
+    if ci_width is None or len(seed_results) < min_seeds:
+        return False
+    successes = sum(1 for result in seed_results if result['success'])
+    return wilson_interval_width(successes, len(seed_results)) <= ci_width
+
+# Extends the contiguous prefix of arrived seeds of a configuration (in configuration_seeds order)
+# one seed at a time, and tells whether the configuration is finished: every seed arrived or, with
+# adaptive sampling, the prefix became precise enough. Later seeds wait in 'arrived' until the gap
+# before them is filled, so the stopping point does not depend on the order batches finish in
+# (successful seeds finish first and would bias an early stop towards success).
+def advance_prefix(progress, ci_width, min_seeds):
+    order, arrived, prefix = progress['order'], progress['arrived'], progress['prefix']
+    while len(prefix) < len(order) and order[len(prefix)] in arrived:
+        prefix.append(arrived[order[len(prefix)]])
+        if is_precise_enough(prefix, ci_width, min_seeds):
+            return True
+    return len(prefix) == len(order)
+
+# Number of seeds per task: cheap seeds are grouped, expensive ones run on their own
+def seed_batch_size(config_params, num_seeds, adaptive=False):
+    if config_params.get('engine') == 'batch':
+        # Lockstep walks amortise the NumPy overhead over the batch: the more seeds the better
+        batch_size = max(1, min(num_seeds, BATCH_ENGINE_WALKS))
+    else:
+        work = config_params['n'] * config_params['max_flips'] * config_params['max_tries']
+        batch_size = max(1, min(num_seeds, SEED_BATCH_WORK // max(1, work)))
+    # Small batches let an adaptive configuration stop shortly after it becomes precise
+    return min(batch_size, ADAPTIVE_SEED_BATCH) if adaptive else batch_size
 
 # Check if all configurations have been completed
 def check_completion_status(results_df, n_values, p_values=None, c_values=None, Q_values=None, m_n_ratios=None, algorithm_type='WalkSAT_community'):
@@ -130,74 +180,308 @@ def check_completion_status(results_df, n_values, p_values=None, c_values=None,
     
     return len(missing_configs) == 0, missing_configs
 
-# Load existing results from a file or return None if the file does not exist
-def load_existing_results(results_file):
-    if not os.path.exists(results_file):
-        return None
-    
-    data = []
-    with open(results_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or 'Success Rate:' not in line:
-                continue
-            
-            try:
-                parts = [p.strip() for p in line.split(',')]
-                config_data = {}
-                for part in parts:
-                    if '=' in part:
-                        key, value = part.split('=')
-                        config_data[key.strip()] = value.strip()
-                    elif 'Success Rate:' in part:
-                        config_data['Success'] = float(part.split(':')[1].strip('%'))
-                    elif 'Total Flips:' in part:
-                        config_data['Flips'] = int(part.split(':')[1].strip())
-                    elif 'Time:' in part:
-                        config_data['Time'] = float(part.split(':')[1].replace('seconds', '').strip())
-                
-                if 'c' in config_data and 'Q' in config_data:
-                    data.append({
-                        'Configurations': f"c={config_data['c']}, Q={config_data['Q']}, p={config_data['p']}, n={config_data['n']}, m/n={config_data['m/n']}, max_tries={config_data.get('max_tries', 1)}, max_flips={config_data.get('max_flips', 0)}",
-                        'Success Rate': config_data['Success'],
-                        'Time (seconds)': config_data.get('Time', 0),
-                        'Total Flips': config_data.get('Flips', 0),
-                        'Max Tries': int(config_data.get('max_tries', 1)),
-                        'Max Flips': int(config_data.get('max_flips', 0)),
-                        'c': int(config_data['c']),
-                        'Q': float(config_data['Q']),
-                        'p': float(config_data['p']),
-                        'n': int(config_data['n']),
-                        'm/n': float(config_data['m/n'])
-                    })
-                elif 'p' in config_data:
-                    data.append({
-                        'Configurations': f"p={config_data['p']}, n={config_data['n']}, m/n={config_data['m/n']}, max_tries={config_data.get('max_tries', 1)}, max_flips={config_data.get('max_flips', 0)}",
-                        'Success Rate': config_data['Success'],
-                        'Time (seconds)': config_data.get('Time', 0),
-                        'Total Flips': config_data.get('Flips', 0),
-                        'Max Tries': int(config_data.get('max_tries', 1)),
-                        'Max Flips': int(config_data.get('max_flips', 0)),
-                        'p': float(config_data['p']),
-                        'n': int(config_data['n']),
-                        'm/n': float(config_data['m/n'])
-                    })
-                else:
-                    data.append({
-                        'Configurations': f"n={config_data['n']}, m/n={config_data['m/n']}, max_tries={config_data.get('max_tries', 1)}, max_flips={config_data.get('max_flips', 0)}",
-                        'Success Rate': config_data['Success'],
-                        'Time (seconds)': config_data.get('Time', 0),
-                        'Total Flips': config_data.get('Flips', 0),
-                        'Max Tries': int(config_data.get('max_tries', 1)),
-                        'Max Flips': int(config_data.get('max_flips', 0)),
-                        'n': int(config_data['n']),
-                        'm/n': float(config_data['m/n'])
-                    })
-            except Exception as e:
-                print(f"Error processing line: {line}\nError: {str(e)}")
-                continue
-    
-    return pd.DataFrame(data) if data else None
+# Build the DataFrame row of a finished configuration
+def build_result_row(config, results, algorithm_type):
+    params = config['params']
+    new_row = {
+        'Configurations': config['config_str'],
+        'Success Rate': results['success_rate'],
+        'Time (seconds)': results['execution_time'],
+        'Total Flips': results['total_flips'],
+        'Seeds': results['seeds'],
+        'Max Tries': params['max_tries'],
+        'Max Flips': params['max_flips']
+    }
+    if algorithm_type == 'WalkSAT_community':
+        new_row.update({'c': params['c'], 'Q': params['Q']})
+    if algorithm_type != 'GSAT':
+        new_row['p'] = params['p']
+    new_row.update({'n': params['n'], 'm/n': params['m_n']})
+    return new_row
+
+class ResultsAccumulator:
+    # Rows of finished configurations indexed by configuration string; the DataFrame is built once
+    def __init__(self, results_df=None):
+        self.rows = {}
+        if results_df is not None:
+            for row in results_df.to_dict('records'):
+                self.rows[row['Configurations']] = row
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, config_str):
+        return config_str in self.rows
+
+    def add(self, row):
+        self.rows[row['Configurations']] = row
+
+    def success_rate(self, config_str):
+        return float(self.rows[config_str]['Success Rate'])
+
+    def to_dataframe(self):
+        if not self.rows:
+            return pd.DataFrame(columns=[
+                'Configurations', 'Success Rate', 'Time (seconds)', 
+                'Total Flips', 'Seeds', 'Max Tries', 'Max Flies','c', 'Q', 'p', 'n', 'm/n'
+            ])
+        return pd.DataFrame(list(self.rows.values()))
+
+# A priori cost of a configuration: flips attempted times clauses touched per flip, scaled by
+# the fraction of seeds expected to run out of flips (logistic around the phase transition)
+def model_config_cost(params):
+    hardness = 1 / (1 + math.exp(-(params['m_n'] - PHASE_TRANSITION_RATIO) / 0.15))
+    work = params['n'] * params['m_n'] * params['max_flips'] * params['max_tries']
+    return work * (0.05 + hardness)
+
+# Expected cost of every pending configuration, calibrated with the times already recorded:
+# the model is corrected by the measured/model ratio of the closest m/n recorded for the same n
+def estimate_config_costs(configs, results):
+    calibration = {}
+    for row in results.rows.values():
+        try:
+            params = {'n': int(row['n']), 'm_n': float(row['m/n']),
+                      'max_flips': int(row['Max Flips']), 'max_tries': int(row['Max Tries'])}
+            ratio = float(row['Time (seconds)']) / model_config_cost(params)
+        except (KeyError, TypeError, ValueError, ZeroDivisionError):
+            continue
+        if ratio > 0:
+            calibration.setdefault(params['n'], []).append((params['m_n'], ratio))
+
+    default_ratio = float(np.median([ratio for rows in calibration.values() for _, ratio in rows])) if calibration else 1.0
+    for rows in calibration.values():
+        rows.sort()
+    ratios_by_n = {n: [m_n for m_n, _ in rows] for n, rows in calibration.items()}
+
+    costs = []
+    for config in configs:
+        params = config['params']
+        rows = calibration.get(params['n'])
+        if rows:
+            # Closest recorded m/n by binary search on the sorted ratios
+            position = bisect.bisect_left(ratios_by_n[params['n']], params['m_n'])
+            neighbours = rows[max(0, position - 1):position + 1]
+            ratio = min(neighbours, key=lambda row: abs(row[0] - params['m_n']))[1]
+        else:
+            ratio = default_ratio
+        costs.append(model_config_cost(params) * ratio)
+    return costs
+
+# Parameters of every success curve of the sweep (all parameters except m/n)
+def build_curves(n_values, p_values, c_values, Q_values, k, max_tries_values, max_flips_values,
+                 max_flips_coef_values, algorithm_type, generator, partition, engine='python', solver=None):
+    curves = []
+    for n in n_values:
+        for max_tries in max_tries_values:
+            if max_flips_values is not None:
+                current_max_flips_list = max_flips_values
+            else:
+                current_max_flips_list = [coef * n for coef in max_flips_coef_values]
+            for max_flips in current_max_flips_list:
+                base = {'n': n, 'k': k, 'max_tries': max_tries, 'max_flips': max_flips, 'generator': generator,
+                        'solver': solver}
+                if algorithm_type == 'GSAT':
+                    curves.append(base)
+                    continue
+                for p in p_values:
+                    if algorithm_type == 'WalkSAT_community':
+                        for c in c_values:
+                            for Q in Q_values:
+                                if n == 50 and c in [20,30]:
+                                    continue
+                                curves.append({**base, 'p': p, 'c': c, 'Q': Q, 'partition': partition, 'engine': engine})
+                    else:
+                        curves.append({**base, 'p': p, 'engine': engine})
+    return curves
+
+# Configuration of a curve at a given m/n ratio
+def build_config(curve, m_n, algorithm_type):
+    params = {**curve, 'm_n': m_n}
+    if algorithm_type == 'WalkSAT_community':
+        config_str = f"c={params['c']}, Q={params['Q']}, p={params['p']}, n={params['n']}, m/n={m_n:.1f}, max_tries={params['max_tries']}, max_flips={params['max_flips']}"
+    elif algorithm_type == 'WalkSAT_random':
+        config_str = f"p={params['p']}, n={params['n']}, m/n={m_n:.1f}, max_tries={params['max_tries']}, max_flips={params['max_flips']}"
+    else:
+        config_str = f"n={params['n']}, m/n={m_n:.1f}, max_tries={params['max_tries']}, max_flips={params['max_flips']}"
+    return {'config_str': config_str, 'params': params}
+
+# Run a list of configurations in the worker pool, recording every finished one
+def run_configurations(all_configs, results, store, num_seeds=100, algorithm_type='WalkSAT_community',
+                       ci_width=None, min_seeds=20, master_seed=0):
+    # Longest expected configurations first so the hard ones do not form the tail of the sweep
+    costs = estimate_config_costs(all_configs, results)
+    all_configs = [config for _, config in sorted(zip(costs, all_configs), key=lambda item: -item[0])]
+
+    def finish(config):
+        summary = aggregate_seed_results(progress.pop(config['config_str'])['prefix'])
+        new_row = build_result_row(config, summary, algorithm_type)
+        results.add(new_row)
+        store.append([new_row])
+
+    # Split every configuration into seed batches; seeds checkpointed by an interrupted run are
+    # reused and only the missing ones are drawn. Results are reduced per configuration over the
+    # first num_seeds seeds of its order, the same ones as an uninterrupted run.
+    checkpoints = store.load_seed_results()
+    tasks = deque()
+    progress = {}
+    resumed = 0
+    for config in all_configs:
+        order = configuration_seeds(master_seed, config['params'])[:num_seeds]
+        wanted = set(order)
+        arrived = {result['seed']: result for result in checkpoints.get(config['config_str'], [])
+                   if result['seed'] in wanted}
+        progress[config['config_str']] = {'order': order, 'arrived': arrived, 'prefix': []}
+        resumed += len(arrived)
+        if advance_prefix(progress[config['config_str']], ci_width, min_seeds):
+            finish(config)
+            continue
+        seeds = [seed for seed in order if seed not in arrived]
+        batch_size = seed_batch_size(config['params'], num_seeds, adaptive=ci_width is not None)
+        for i in range(0, len(seeds), batch_size):
+            tasks.append((config, seeds[i:i + batch_size], 0))
+
+    if resumed:
+        print(f"\nResuming from {resumed} checkpointed seeds")
+    print(f"\nRunning {len(progress)} pending configurations in {len(tasks)} seed batches...")
+    pbar = tqdm(total=len(tasks), desc="Progress")
+    executor = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+    # After a worker died, the batches lost with its pool are rerun one at a time in a single-worker
+    # quarantine pool while the main pool keeps running the sweep: a retry is only charged to a
+    # batch that kills a worker on its own
+    quarantine = None
+    try:
+        futures = {}
+        suspects = deque()  # Batches lost with a broken pool, not yet known to be the one that broke it
+        isolated = None  # Future of the suspect running in the quarantine pool
+        while True:
+            # Keep a bounded number of seed batches queued so no worker sits idle
+            while len(futures) < MAX_IN_FLIGHT and tasks:
+                config, seeds, attempt = tasks.popleft()
+                if config['config_str'] not in progress:
+                    pbar.update(1)
+                    continue
+                future = executor.submit(run_seed_batch, config['params'], seeds, f"{master_seed}:{config['config_str']}")
+                futures[future] = (config, seeds, attempt)
+            while isolated is None and suspects:
+                config, seeds, attempt = suspects.popleft()
+                if config['config_str'] not in progress:
+                    pbar.update(1)
+                    continue
+                if quarantine is None:
+                    quarantine = ProcessPoolExecutor(max_workers=1)
+                isolated = quarantine.submit(run_seed_batch, config['params'], seeds, f"{master_seed}:{config['config_str']}")
+                futures[isolated] = (config, seeds, attempt)
+            if not futures:
+                break
+
+            broken_pool = False
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                config, seeds, attempt = futures.pop(future)
+                alone = future is isolated
+                if alone:
+                    isolated = None
+                config_str = config['config_str']
+                if config_str not in progress:
+                    pbar.update(1)
+                    continue
+
+                try:
+                    batch_results = future.result()
+                except BrokenProcessPool:
+                    # A worker died (killed, out of memory...): any batch of the main pool may be the
+                    # one that killed it, so it becomes a suspect; a suspect that kills the quarantine
+                    # worker is retried there until it runs out of retries
+                    if not alone:
+                        broken_pool = True
+                        suspects.append((config, seeds, attempt))
+                        continue
+                    quarantine.shutdown(wait=False, cancel_futures=True)
+                    quarantine = None
+                    if attempt + 1 < MAX_RETRIES:
+                        suspects.appendleft((config, seeds, attempt + 1))
+                        continue
+                    progress.pop(config_str)
+                    pbar.update(1)
+                    print(f"\nError in {config_str}: worker process died {MAX_RETRIES} times")
+                    continue
+                except Exception as e:
+                    progress.pop(config_str)
+                    pbar.update(1)
+                    print(f"\nError in {config_str}: {str(e)}")
+                    continue
+
+                pbar.update(1)
+                # Checkpoint the seeds of the batch (one transaction) before counting them
+                store.append_seed_results(config_str, batch_results)
+                progress[config_str]['arrived'].update((result['seed'], result) for result in batch_results)
+                if not advance_prefix(progress[config_str], ci_width, min_seeds):
+                    continue
+
+                # Seed batches of this configuration still queued are no longer needed
+                for queued, (queued_config, _, _) in futures.items():
+                    if queued_config is config:
+                        queued.cancel()
+                finish(config)
+
+            if broken_pool:
+                # Batches still assigned to the broken pool are lost with it: they become suspects too
+                for future in [future for future in futures if future is not isolated]:
+                    suspects.append(futures.pop(future))
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if quarantine is not None:
+            quarantine.shutdown(wait=False, cancel_futures=True)
+        pbar.close()
+
+# Indices of the m/n grid to run next on a curve: the middle point of every interval between two
+# measured ratios where the success rate crosses 50%, until neighbouring grid points are reached
+def refine_transition(measured, attempted):
+    indices = sorted(measured)
+    refinements = []
+    for low, high in zip(indices, indices[1:]):
+        if high - low > 1 and (measured[low] >= 50) != (measured[high] >= 50):
+            middle = (low + high) // 2
+            if middle not in attempted:
+                refinements.append(middle)
+    return refinements
+
+# Adaptive sweep: every curve starts on a coarse subset of the m/n grid and is bisected only
+# where its success rate crosses 50%
+def run_adaptive_sweep(curves, m_n_ratios, coarse_stride, results, store, **run_options):
+    algorithm_type = run_options['algorithm_type']
+    m_n_ratios = sorted(m_n_ratios)
+    coarse = sorted(set(range(0, len(m_n_ratios), coarse_stride)) | {len(m_n_ratios) - 1})
+    grid = [[build_config(curve, m_n, algorithm_type) for m_n in m_n_ratios] for curve in curves]
+    attempted = [set() for _ in curves]
+    next_indices = [coarse for _ in curves]
+
+    round_number = 0
+    while True:
+        pending = []
+        for curve_index, indices in enumerate(next_indices):
+            for index in indices:
+                attempted[curve_index].add(index)
+                if grid[curve_index][index]['config_str'] not in results:
+                    pending.append(grid[curve_index][index])
+
+        if pending:
+            round_number += 1
+            print(f"\nRefinement round {round_number}:")
+            run_configurations(pending, results, store, **run_options)
+        elif round_number == 0:
+            print("\nNo pending configurations in the coarse grid.")
+
+        next_indices = []
+        for curve_index, configs in enumerate(grid):
+            measured = {index: results.success_rate(config['config_str']) for index, config in enumerate(configs)
+                        if config['config_str'] in results}
+            next_indices.append(refine_transition(measured, attempted[curve_index]))
+        if not any(next_indices):
+            return
 
 # Execute the experiment in parallel
 def run_experiment_parallel(
@@ -212,218 +496,72 @@ def run_experiment_parallel(
     max_flips_coef_values=None,  
     m_n_ratios=np.arange(2.5, 5.5, 0.1),
     num_seeds=100,
-    algorithm_type='WalkSAT_community'
+    algorithm_type='WalkSAT_community',
+    generator='external',
+    partition='louvain',
+    ci_width=None,
+    min_seeds=20,
+    sweep='grid',
+    coarse_stride=5,
+    master_seed=0,
+    engine='python',
+    solver=None
 ):
+    solver = resolve_solver(algorithm_type, experiment_name, solver)
+    spec = get_solver(solver)
+    if (spec.model == 'community') != (algorithm_type == 'WalkSAT_community') or spec.noise != (algorithm_type != 'GSAT'):
+        raise ValueError(f"Solver {solver} does not run {algorithm_type} configurations")
+    if engine == 'batch' and not spec.batch:
+        raise ValueError(f"The batch engine only runs plain WalkSAT (WalkSAT_random or the v00 community baseline), not {solver}")
+
+
     os.makedirs('data/results', exist_ok=True)
     
     results_txt_file = f'data/results/results_{experiment_name}.txt'
-    
-    results_df = load_existing_results(results_txt_file)
+    results_db_file = store_path(results_txt_file)
+
+    # Results of older runs only exist as TXT: import them once into the database
+    if not os.path.exists(results_db_file) and os.path.exists(results_txt_file):
+        imported = import_results_txt(results_txt_file, results_db_file)
+        print(f"\nImported {imported} results from {results_txt_file}")
 
-    if results_df is None:
+    store = ResultsStore(results_db_file)
+    results = ResultsAccumulator(store.load())
+
+    if not results:
         print("\nNo previous results found. Starting experiments from scratch...")
-        results_df = pd.DataFrame(columns=[
-            'Configurations', 'Success Rate', 'Time (seconds)', 
-            'Total Flips', 'Max Tries', 'Max Flies','c', 'Q', 'p', 'n', 'm/n'
-        ])
-        
-        # Escribir encabezado en archivo TXT
-        with open(results_txt_file, 'w') as f:
-            f.write(f"Experiment: {experiment_name}\n")
-            f.write(f"Start date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("="*80 + "\n\n")
     else:
         print("\nPrevious results found. Continuing from the last checkpoint...")
 
-    all_configs = []
-    for n in n_values:
-        for max_tries in max_tries_values:
-            if max_flips_values is not None:
-                current_max_flips_list = max_flips_values
+    curves = build_curves(n_values, p_values, c_values, Q_values, k, max_tries_values, max_flips_values,
+                          max_flips_coef_values, algorithm_type, generator, partition, engine, solver)
+    run_options = dict(num_seeds=num_seeds, algorithm_type=algorithm_type,
+                       ci_width=ci_width, min_seeds=min_seeds, master_seed=master_seed)
+
+    try:
+        if sweep == 'adaptive':
+            run_adaptive_sweep(curves, m_n_ratios, coarse_stride, results, store, **run_options)
+        else:
+            all_configs = [config for config in (build_config(curve, m_n, algorithm_type)
+                                                 for curve in curves for m_n in m_n_ratios)
+                           if config['config_str'] not in results]
+            if all_configs:
+                run_configurations(all_configs, results, store, **run_options)
             else:
-                current_max_flips_list = [coef * n for coef in max_flips_coef_values]
-            for max_flips in current_max_flips_list:
-                if algorithm_type != 'GSAT':
-                    for p in p_values:
-                        if algorithm_type == 'WalkSAT_community':
-                            for c in c_values:
-                                for Q in Q_values:
-                                    for m_n in m_n_ratios:
-                                        config_str = f'c={c}, Q={Q}, p={p}, n={n}, m/n={m_n:.1f}, max_tries={max_tries}, max_flips={max_flips}'
-                                        if not results_df.empty and config_str in results_df['Configurations'].values:
-                                            continue
-                                        if n == 50 and c in [20,30]:
-                                            continue
-                                        all_configs.append({
-                                            'config_str': config_str,
-                                            'params': {
-                                                'n': n,
-                                                'p': p,
-                                                'c': c,
-                                                'Q': Q,
-                                                'k': k,
-                                                'max_tries': max_tries,
-                                                'max_flips': max_flips,
-                                                'm_n': m_n
-                                            }
-                                        })
-                        else:
-                            for m_n in m_n_ratios:
-                                config_str = f'p={p}, n={n}, m/n={m_n:.1f}, max_tries={max_tries}, max_flips={max_flips}'
-                                if not results_df.empty and config_str in results_df['Configurations'].values:
-                                            continue
-                                all_configs.append({
-                                    'config_str': config_str,
-                                    'params': {
-                                        'n': n,
-                                        'p': p,
-                                        'k': k,
-                                        'max_tries': max_tries,
-                                        'max_flips': max_flips,
-                                        'm_n': m_n
-                                    }
-                                })
-                else:
-                    for m_n in m_n_ratios:
-                        config_str = f'n={n}, m/n={m_n:.1f}, max_tries={max_tries}, max_flips={max_flips}'
-                        if not results_df.empty and config_str in results_df['Configurations'].values:
-                            continue
-                                          
-                        all_configs.append({
-                            'config_str': config_str,
-                            'params': {
-                                'n': n,
-                                'k': k,
-                                'max_tries': max_tries,
-                                'max_flips': max_flips,
-                                'm_n': m_n
-                            }
-                        })
-    
-    if all_configs:
-        print(f"\nRunning {len(all_configs)} pending configurations...")
-        pbar = tqdm(total=len(all_configs), desc="Progress")
-        try:    
-            i = 0
-            while i < len(all_configs):
-                chunk = all_configs[i:i + CHUNK_SIZE]
-                i += len(chunk)
-                pbar.update(len(chunk))
-                
-                with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                    futures = {
-                        executor.submit(run_single_configuration, config['params'], num_seeds, algorithm_type, experiment_name): config
-                        for config in chunk
-                    }
-                    
-                    for future in as_completed(futures):
-                        config = futures[future]
-                        
-                        try:
-                            results = future.result()
-                            if algorithm_type == 'WalkSAT_community':
-                                new_row = {
-                                    'Configurations': config['config_str'],
-                                    'Success Rate': results['success_rate'],
-                                    'Time (seconds)': results['execution_time'],
-                                    'Total Flips': results['total_flips'],
-                                    'Max Tries': config['params']['max_tries'],
-                                    'Max Flips': config['params']['max_flips'],
-                                    'c': config['params']['c'],
-                                    'Q': config['params']['Q'],
-                                    'p': config['params']['p'],
-                                    'n': config['params']['n'],
-                                    'm/n': config['params']['m_n']
-                                }
-                            elif algorithm_type == 'WalkSAT_random':
-                                new_row = {
-                                    'Configurations': config['config_str'],
-                                    'Success Rate': results['success_rate'],
-                                    'Time (seconds)': results['execution_time'],
-                                    'Total Flips': results['total_flips'],
-                                    'Max Tries': config['params']['max_tries'],
-                                    'Max Flips': config['params']['max_flips'],
-                                    'p': config['params']['p'],
-                                    'n': config['params']['n'],
-                                    'm/n': config['params']['m_n']
-                                }
-                            else:
-                                new_row = {
-                                    'Configurations': config['config_str'],
-                                    'Success Rate': results['success_rate'],
-                                    'Time (seconds)': results['execution_time'],
-                                    'Total Flips': results['total_flips'],
-                                    'Max Tries': config['params']['max_tries'],
-                                    'Max Flips': config['params']['max_flips'],
-                                    'n': config['params']['n'],
-                                    'm/n': config['params']['m_n']
-                                }
-                            results_df = pd.concat([results_df, pd.DataFrame([new_row])], ignore_index=True)
-                            
-                            with open(results_txt_file, 'a') as f:
-                                if 'p' in new_row:
-                                    f.write(f"{config['config_str']}, Success Rate: {results['success_rate']:.1f}%, "
-                                        f"Total Flips: {results['total_flips']}, "
-                                        f"Time: {results['execution_time']:.2f} seconds\n")
-                                else:
-                                    f.write(f"{config['config_str']}, Success Rate: {results['success_rate']:.1f}%, "
-                                        f"Total Flips: {results['total_flips']}, "
-                                        f"Time: {results['execution_time']:.2f} seconds\n")
-                            
-                        except Exception as e:
-                            print(f"\nError in {config['config_str']}: {str(e)}")
-        
-        finally:
-            pbar.close()
-    else:
-        print("\nNo pending configurations. All experiments are complete.")
-    
-    print("Sorting results in the files...")
-    clean_and_reorder_results(results_txt_file, results_df)
+                print("\nNo pending configurations. All experiments are complete.")
+        stored_results = store.count()
+    finally:
+        store.close()
+
+    # The sorted report is derived from the store: rewrite it when it is missing or was written with
+    # a different number of results (also the ones stored by an interrupted run of another sweep)
+    results_df = results.to_dataframe()
+    if report_results(results_txt_file) != stored_results:
+        print("Sorting results in the files...")
+        clean_and_reorder_results(results_txt_file, results_df)
 
     return results_df
 
 # Clean and reorder results in the results file
 def clean_and_reorder_results(results_file, results_df):
-    if 'c' in results_df and 'Q' in results_df:
-        group_params = ['n', 'c', 'Q', 'p', 'Max Tries', 'Max Flips']
-    elif 'p' in results_df:
-        group_params = ['n', 'p', 'Max Tries', 'Max Flips']
-    else:
-        group_params = ['n', 'Max Tries', 'Max Flips']
-    
-    varying_params = [param for param in group_params 
-                      if len(results_df[param].unique()) > 1]
-    
-    varying_params.append('m/n') 
-    if not varying_params:
-        varying_params = ['m/n']
-    
-    results_df = results_df.sort_values(varying_params)
-    
-    def write_groups(df, params, file_handle, indent_level=0):
-        current_param = params[0] if params else None
-        
-        if not params:
-            for _, row in df.iterrows():
-                file_handle.write("    " * indent_level + 
-                                f"{row['Configurations']}, Success Rate: {row['Success Rate']:.1f}%, "
-                                f"Total Flips: {row['Total Flips']}, Time: {row['Time (seconds)']:.2f} seconds\n")
-            return
-        
-        grouped = df.groupby(current_param, sort=False)
-        
-        for value, group in grouped:
-            if current_param != 'm/n':
-                file_handle.write("    " * indent_level + f"\n{'#' * 20} {current_param} = {value} {'#' * 20}\n")
-                indent_level = -1
-            write_groups(group, params[1:], file_handle, indent_level + 1)
-
-    with open(results_file, 'w') as f:
-        f.write(f"Sorted results - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 80 + "\n")
-        
-        write_groups(results_df, varying_params, f)
-        
-        f.write("\n" + "=" * 80 + "\n")
-        f.write("End of results\n")
+    write_report(results_df, results_file)
@@ -5,8 +5,28 @@ from itertools import cycle
 from collections import defaultdict
 from tabulate import tabulate
 
+# Run as a script (python modules/plot_results.py) or imported as modules.plot_results
+try:
+    from modules.results_store import ResultsStore
+except ImportError:
+    from results_store import ResultsStore
+
+# Load a SQLite results store with the column names used by parse_results_file
+def load_results_store(filename):
+    with ResultsStore(filename) as store:
+        df = store.load()
+    if df is None:
+        return pd.DataFrame()
+    df = df.rename(columns={'Time (seconds)': 'Time'})
+    df['max_tries'] = df['Max Tries']
+    df['max_flips'] = df['Max Flips']
+    return df
+
 # Analize results file and return a DataFrame
 def parse_results_file(filename):
+    if filename.endswith('.db'):
+        return load_results_store(filename)
+
     data = []
     current_section = {}
     
@@ -366,6 +386,8 @@ def analyze_results(filename):
     base_name = filename
     if base_name.lower().endswith('.txt'):
         base_name = base_name[:-4]
+    elif base_name.lower().endswith('.db'):
+        base_name = base_name[:-3]
     plot_file = base_name.replace('results/', 'plots\\') + '.png'
     metrics_output_file = base_name.replace('results/', 'metrics\\') + '.txt'
 
@@ -384,5 +406,5 @@ def analyze_results(filename):
     )
 
 if __name__ == "__main__":
-    filename = r"data/results/results_WalkSAT_community_v02.txt"
+    filename = r"data/results/results_WalkSAT_community_v02.db"
     analyze_results(filename)
\ No newline at end of file
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+Almacén de resultados de los experimentos en SQLite (una fila tipada por configuración)
+"""
+
+import os
+import sqlite3
+import stat
+import sys
+import tempfile
+import pandas as pd
+from datetime import datetime
+
+# DataFrame column, SQLite column and SQLite type of every stored field
+COLUMNS = [
+    ('Configurations', 'config', 'TEXT PRIMARY KEY'),
+    ('Success Rate', 'success_rate', 'REAL'),
+    ('Seeds', 'seeds', 'INTEGER'),
+    ('Total Flips', 'total_flips', 'INTEGER'),
+    ('Time (seconds)', 'time', 'REAL'),
+    ('Max Tries', 'max_tries', 'INTEGER'),
+    ('Max Flips', 'max_flips', 'INTEGER'),
+    ('c', 'c', 'INTEGER'),
+    ('Q', 'q', 'REAL'),
+    ('p', 'p', 'REAL'),
+    ('n', 'n', 'INTEGER'),
+    ('m/n', 'm_n', 'REAL'),
+]
+OPTIONAL_COLUMNS = ['Seeds', 'c', 'Q', 'p']  # Dropped from loaded frames when no row has them
+
+# Outcome of every seed, checkpointed as soon as its batch returns
+SEED_COLUMNS = [
+    ('seed', 'INTEGER'),
+    ('success', 'INTEGER'),
+    ('tries', 'INTEGER'),
+    ('flips', 'INTEGER'),
+    ('time', 'REAL'),
+]
+
+# Database file that goes with a TXT results file
+def store_path(results_txt_file):
+    return os.path.splitext(results_txt_file)[0] + '.db'
+
+class ResultsStore:
+    # Opens (and creates if needed) the results table of an experiment
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        columns = ', '.join(f'{name} {sql_type}' for _, name, sql_type in COLUMNS)
+        self.connection.execute(f'CREATE TABLE IF NOT EXISTS results ({columns})')
+        seed_columns = ', '.join(f'{name} {sql_type}' for name, sql_type in SEED_COLUMNS)
+        self.connection.execute(f'CREATE TABLE IF NOT EXISTS seed_results (config TEXT, {seed_columns}, '
+                                'PRIMARY KEY (config, seed))')
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Inserts (or replaces) result rows given as dicts with the DataFrame column names
+    def append(self, rows):
+        names = ', '.join(name for _, name, _ in COLUMNS)
+        placeholders = ', '.join('?' for _ in COLUMNS)
+        values = [tuple(_to_sql(row.get(column), sql_type) for column, _, sql_type in COLUMNS) for row in rows]
+        with self.connection:
+            self.connection.executemany(f'INSERT OR REPLACE INTO results ({names}) VALUES ({placeholders})', values)
+
+    # Checkpoints the outcomes of a batch of seeds of a configuration atomically
+    def append_seed_results(self, config_str, seed_results):
+        names = ', '.join(name for name, _ in SEED_COLUMNS)
+        placeholders = ', '.join('?' for _ in range(len(SEED_COLUMNS) + 1))
+        values = [(config_str, *(_to_sql(result[name], sql_type) for name, sql_type in SEED_COLUMNS))
+                  for result in seed_results]
+        with self.connection:
+            self.connection.executemany(f'INSERT OR REPLACE INTO seed_results (config, {names}) VALUES ({placeholders})', values)
+
+    # Checkpointed seeds of the configurations without a final result, by configuration string
+    def load_seed_results(self):
+        names = ', '.join(name for name, _ in SEED_COLUMNS)
+        checkpoints = {}
+        for config, *values in self.connection.execute(
+                f'SELECT config, {names} FROM seed_results '
+                'WHERE config NOT IN (SELECT config FROM results) ORDER BY rowid'):
+            result = dict(zip((name for name, _ in SEED_COLUMNS), values))
+            result['success'] = bool(result['success'])
+            checkpoints.setdefault(config, []).append(result)
+        return checkpoints
+
+    # Number of stored results
+    def count(self):
+        return self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    # All results in insertion order with the DataFrame column names, or None if there are none
+    def load(self):
+        names = ', '.join(name for _, name, _ in COLUMNS)
+        df = pd.read_sql_query(f'SELECT {names} FROM results ORDER BY rowid', self.connection)
+        if df.empty:
+            return None
+        df.columns = [column for column, _, _ in COLUMNS]
+        empty = [column for column in OPTIONAL_COLUMNS if df[column].isna().all()]
+        return df.drop(columns=empty)
+
+# Python value of the type declared for the column (NumPy scalars are not accepted by sqlite3)
+def _to_sql(value, sql_type):
+    if value is None or pd.isna(value):
+        return None
+    if sql_type.startswith('INTEGER'):
+        return int(value)
+    if sql_type.startswith('REAL'):
+        return float(value)
+    return str(value)
+
+# Parse a TXT results file (raw log or sorted report) into a DataFrame, or None if it does not exist
+def parse_results_txt(results_file):
+    if not os.path.exists(results_file):
+        return None
+
+    data = []
+    with open(results_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or 'Success Rate:' not in line:
+                continue
+
+            try:
+                parts = [p.strip() for p in line.split(',')]
+                config_data = {}
+                for part in parts:
+                    if '=' in part:
+                        key, value = part.split('=')
+                        config_data[key.strip()] = value.strip()
+                    elif 'Success Rate:' in part:
+                        config_data['Success'] = float(part.split(':')[1].strip('%'))
+                    elif 'Seeds:' in part:
+                        config_data['Seeds'] = int(part.split(':')[1].strip())
+                    elif 'Total Flips:' in part:
+                        config_data['Flips'] = int(part.split(':')[1].strip())
+                    elif 'Time:' in part:
+                        config_data['Time'] = float(part.split(':')[1].replace('seconds', '').strip())
+
+                if 'c' in config_data and 'Q' in config_data:
+                    data.append({
+                        'Configurations': f"c={config_data['c']}, Q={config_data['Q']}, p={config_data['p']}, n={config_data['n']}, m/n={config_data['m/n']}, max_tries={config_data.get('max_tries', 1)}, max_flips={config_data.get('max_flips', 0)}",
+                        'Success Rate': config_data['Success'],
+                        'Time (seconds)': config_data.get('Time', 0),
+                        'Total Flips': config_data.get('Flips', 0),
+                        'Seeds': config_data.get('Seeds'),
+                        'Max Tries': int(config_data.get('max_tries', 1)),
+                        'Max Flips': int(config_data.get('max_flips', 0)),
+                        'c': int(config_data['c']),
+                        'Q': float(config_data['Q']),
+                        'p': float(config_data['p']),
+                        'n': int(config_data['n']),
+                        'm/n': float(config_data['m/n'])
+                    })
+                elif 'p' in config_data:
+                    data.append({
+                        'Configurations': f"p={config_data['p']}, n={config_data['n']}, m/n={config_data['m/n']}, max_tries={config_data.get('max_tries', 1)}, max_flips={config_data.get('max_flips', 0)}",
+                        'Success Rate': config_data['Success'],
+                        'Time (seconds)': config_data.get('Time', 0),
+                        'Total Flips': config_data.get('Flips', 0),
+                        'Seeds': config_data.get('Seeds'),
+                        'Max Tries': int(config_data.get('max_tries', 1)),
+                        'Max Flips': int(config_data.get('max_flips', 0)),
+                        'p': float(config_data['p']),
+                        'n': int(config_data['n']),
+                        'm/n': float(config_data['m/n'])
+                    })
+                else:
+                    data.append({
+                        'Configurations': f"n={config_data['n']}, m/n={config_data['m/n']}, max_tries={config_data.get('max_tries', 1)}, max_flips={config_data.get('max_flips', 0)}",
+                        'Success Rate': config_data['Success'],
+                        'Time (seconds)': config_data.get('Time', 0),
+                        'Total Flips': config_data.get('Flips', 0),
+                        'Seeds': config_data.get('Seeds'),
+                        'Max Tries': int(config_data.get('max_tries', 1)),
+                        'Max Flips': int(config_data.get('max_flips', 0)),
+                        'n': int(config_data['n']),
+                        'm/n': float(config_data['m/n'])
+                    })
+            except Exception as e:
+                print(f"Error processing line: {line}\nError: {str(e)}")
+                continue
+
+    return pd.DataFrame(data) if data else None
+
+# Import a TXT results file into its database, returns the number of imported rows. The file is
+# kept as <file>.imported, untouched, since the sorted report is later written to its path
+def import_results_txt(results_file, db_file=None):
+    if not os.path.exists(results_file):
+        return 0
+    df = parse_results_txt(results_file)
+    rows = df.to_dict('records') if df is not None else []
+    if rows:
+        with ResultsStore(db_file or store_path(results_file)) as store:
+            store.append(rows)
+    os.replace(results_file, results_file + '.imported')
+    return len(rows)
+
+# Sorted, human-readable report of the results grouped by the parameters that vary
+def write_report(results_df, report_file):
+    if 'c' in results_df and 'Q' in results_df:
+        group_params = ['n', 'c', 'Q', 'p', 'Max Tries', 'Max Flips']
+    elif 'p' in results_df:
+        group_params = ['n', 'p', 'Max Tries', 'Max Flips']
+    else:
+        group_params = ['n', 'Max Tries', 'Max Flips']
+    
+    varying_params = [param for param in group_params 
+                      if len(results_df[param].unique()) > 1]
+    
+    varying_params.append('m/n') 
+    if not varying_params:
+        varying_params = ['m/n']
+    
+    results_df = results_df.sort_values(varying_params)
+    
+    def write_groups(df, params, file_handle, indent_level=0):
+        current_param = params[0] if params else None
+        
+        if not params:
+            for _, row in df.iterrows():
+                file_handle.write("    " * indent_level + 
+                                f"{row['Configurations']}, Success Rate: {row['Success Rate']:.1f}%, "
+                                + (f"Seeds: {int(row['Seeds'])}, " if pd.notna(row.get('Seeds')) else "")
+                                + f"Total Flips: {row['Total Flips']}, Time: {row['Time (seconds)']:.2f} seconds\n")
+            return
+        
+        grouped = df.groupby(current_param, sort=False)
+        
+        for value, group in grouped:
+            if current_param != 'm/n':
+                file_handle.write("    " * indent_level + f"\n{'#' * 20} {current_param} = {value} {'#' * 20}\n")
+                indent_level = -1
+            write_groups(group, params[1:], file_handle, indent_level + 1)
+
+    # Written next to the report and renamed over it, so a crash never leaves it truncated
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(report_file) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(f"Sorted results - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {len(results_df)} results\n")
+            f.write("=" * 80 + "\n")
+            
+            write_groups(results_df, varying_params, f)
+            
+            f.write("\n" + "=" * 80 + "\n")
+            f.write("End of results\n")
+        # mkstemp creates the file owner-only: give it the mode of the report it replaces (or the umask's)
+        if os.path.exists(report_file):
+            mode = stat.S_IMODE(os.stat(report_file).st_mode)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, report_file)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+# Number of results a sorted report was written with, None if it does not exist or has no count
+def report_results(report_file):
+    if not os.path.exists(report_file):
+        return None
+    with open(report_file, 'r') as f:
+        header = f.readline().split(' - ')
+    if len(header) < 3 or not header[0].startswith('Sorted results') or not header[-1].split()[0].isdigit():
+        return None
+    return int(header[-1].split()[0])
+
+# Write the sorted report of a results database next to it, returns the report path
+def write_store_report(db_file):
+    with ResultsStore(db_file) as store:
+        results_df = store.load()
+    report_file = os.path.splitext(db_file)[0] + '.txt'
+    if results_df is not None:
+        write_report(results_df, report_file)
+    return report_file
+
+if __name__ == "__main__":
+    # TXT files are imported into their database; databases get their sorted TXT report
+    for filename in sys.argv[1:]:
+        if filename.endswith('.db'):
+            print(f"{filename}: report written to {write_store_report(filename)}")
+        else:
+            print(f"{filename}: {import_results_txt(filename)} results imported into {store_path(filename)}")